@@ -28,4 +28,7 @@ mcp = FastMCP(
     name="Cutover MCP Server",
     instructions="A set of tools and resources for interacting with the Cutover platform.",
     lifespan=app_lifespan,
+    # Two modules registering the same tool or resource name is a bug; fail at import
+    # instead of letting the later definition silently replace the earlier one.
+    on_duplicate="error",
 )
@@ -1,12 +1,45 @@
 import asyncio
+import functools
 import logging
 import os
+import random
+import time
 from typing import Any
 
 import httpx
+import orjson
+from pydantic import BaseModel
+
+from cutover_mcp.models import construct_response, trust_api_responses
 
 logger = logging.getLogger(__name__)
 
+# Only these methods are retried on 5xx responses and transport failures; replaying a
+# POST or PATCH could apply the same change twice.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+MAX_RETRY_DELAY = 8
+
+# Concurrent tool calls share pooled keep-alive connections (multiplexed over HTTP/2)
+# instead of each paying for a fresh TCP + TLS handshake. Idle connections are kept for
+# five minutes so the gaps between an agent's bursts of calls do not drain the pool;
+# httpcore drops any the server has closed in the meantime before reusing them.
+CONNECTION_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=300)
+# Nothing has been sent when a connection attempt fails, so these are retried for every method.
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# Successful GET bodies are reused for a few seconds so an agent re-reading the same
+# resource does not pay another round trip. Any write clears the cache.
+# Override the TTL with CUTOVER_MCP_CACHE_TTL; 0 disables caching.
+GET_CACHE_TTL = 10.0
+GET_CACHE_MAXSIZE = 1024
+
+# Headers shared by every client; only Authorization and Core-Url vary per client.
+_BASE_HEADERS = (
+    ("Accept", "application/json"),
+    ("Content-Type", "application/json"),
+    ("User-Agent", "CutoverMCP/0.3.0"),
+)
+
 
 class CutoverAPIError(Exception):
     """Raised for Cutover API failures that should be surfaced to the caller as a
@@ -33,8 +66,8 @@ def _parse_error_messages(response: httpx.Response) -> list[str]:
     JSON:API-style ``{"errors": [{"title": ..., "detail": ...}]}``.
     """
     try:
-        payload = response.json()
-    except (ValueError, httpx.DecodingError):
+        payload = orjson.loads(response.content)
+    except (orjson.JSONDecodeError, httpx.DecodingError):
         return []
 
     if not isinstance(payload, dict):
@@ -60,97 +93,248 @@ def _parse_error_messages(response: httpx.Response) -> list[str]:
     return []
 
 
+async def _backoff(url: str, reason: object, attempt: int) -> None:
+    """Sleep before the next retry. Full jitter keeps concurrent callers from retrying in lockstep."""
+    delay = random.uniform(0, min(2**attempt, MAX_RETRY_DELAY))
+    logger.warning("API error for %s: %s. Retrying in %.2fs", url, reason, delay)
+    await asyncio.sleep(delay)
+
+
+def _decode_body(status_code: int, body: bytes, model: type[BaseModel] | None) -> Any:
+    """Turn a successful response body into what ``APIClient.request`` returns."""
+    # Return empty dict for 204 No Content responses
+    if status_code == 204:
+        return {}
+    if model is not None:
+        if trust_api_responses():
+            return construct_response(model, orjson.loads(body))
+        return model.model_validate_json(body)
+    return orjson.loads(body)
+
+
 class APIClient:
     """
     A thin convenience wrapper around one shared httpx.AsyncClient.
     This class should not be instantiated directly; use the client_mgr.
     """
 
-    def __init__(self, base_url: str, api_key: str, timeout: float = 30.0, core_url: str | None = None):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        core_url: str | None = None,
+        cache_ttl: float = GET_CACHE_TTL,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.core_url = core_url
+        self.cache_ttl = cache_ttl
+        self.headers = dict(_BASE_HEADERS)
+        self.headers["Authorization"] = f"Bearer {api_key}"
+        if core_url:
+            self.headers["Core-Url"] = core_url
         self._client: httpx.AsyncClient | None = None
+        # (url, encoded params) -> (expires_at, (status_code, body)), oldest first
+        self._cache: dict[tuple[str, bytes], tuple[float, tuple[int, bytes]]] = {}
+        # Identical GETs already on the wire; later callers await the same fetch
+        self._inflight: dict[tuple[str, bytes], asyncio.Future[tuple[int, bytes]]] = {}
+        # Bumped on every write so a GET that started before it never repopulates the cache
+        self._cache_generation = 0
+        # Background stale-while-revalidate refreshes, held so they are not garbage collected
+        self._refreshes: set[asyncio.Future[tuple[int, bytes]]] = set()
+        self._closed = False
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Lazily create and cache the underlying httpx.AsyncClient."""
+        """Lazily create and cache the underlying httpx.AsyncClient.
+
+        The check-and-create below must not await: that keeps it atomic on the event
+        loop, so concurrent first requests cannot build two clients.
+        """
+        if self._closed:
+            raise RuntimeError("APIClient has been closed")
         if self._client is None:
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "User-Agent": "CutoverMCP/0.3.0",
-                "Authorization": f"Bearer {self.api_key}",
-            }
-            if self.core_url:
-                headers["Core-Url"] = self.core_url
             self._client = httpx.AsyncClient(
+                http2=True,
+                limits=CONNECTION_LIMITS,
                 timeout=self.timeout,
-                headers=headers,
+                headers=self.headers,
             )
         return self._client
 
     async def aclose(self) -> None:
-        """Close the client session if it exists."""
+        """Cancel background refreshes and close the client session if it exists.
+
+        A closed client refuses further requests rather than opening a new session.
+        """
+        self._closed = True
+        refreshes = list(self._refreshes)
+        for refresh in refreshes:
+            refresh.cancel()
+        await asyncio.gather(*refreshes, return_exceptions=True)
+        self._invalidate_cache()
         if self._client:
             await self._client.aclose()
             self._client = None
 
+    def _invalidate_cache(self) -> None:
+        """Drop every cached GET body and detach in-flight GETs from future callers."""
+        self._cache.clear()
+        self._inflight.clear()
+        self._cache_generation += 1
+
+    async def _cached_get(self, url: str, params: dict[str, Any] | None, stale_ttl: float) -> tuple[int, bytes]:
+        """Serve a GET from the TTL cache, joining an identical in-flight GET when there is one.
+
+        Within ``stale_ttl`` seconds after expiry the stale body is returned at once and
+        refreshed in the background (stale-while-revalidate).
+        """
+        key = (url, orjson.dumps(params, option=orjson.OPT_SORT_KEYS) if params else b"")
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            now = time.monotonic()
+            if now < expires_at:
+                return result
+            if now < expires_at + stale_ttl:
+                refresh = self._fetch(key, url, params)
+                self._refreshes.add(refresh)
+                refresh.add_done_callback(self._refreshes.discard)
+                return result
+
+        # Shielded so one cancelled caller does not cancel the fetch for everyone sharing it.
+        return await asyncio.shield(self._fetch(key, url, params))
+
+    def _fetch(
+        self, key: tuple[str, bytes], url: str, params: dict[str, Any] | None
+    ) -> asyncio.Future[tuple[int, bytes]]:
+        """Return the in-flight GET for ``key``, starting one if none is running."""
+        fetch = self._inflight.get(key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._send("GET", url, None, params))
+            self._inflight[key] = fetch
+            fetch.add_done_callback(functools.partial(self._store_cached, key, self._cache_generation))
+        return fetch
+
+    def _store_cached(self, key: tuple[str, bytes], generation: int, fetch: asyncio.Future[tuple[int, bytes]]) -> None:
+        """Done-callback for a shared GET: cache its body unless it failed or a write happened meanwhile."""
+        if self._inflight.get(key) is fetch:
+            del self._inflight[key]
+        if fetch.cancelled() or fetch.exception() is not None or generation != self._cache_generation:
+            return
+        # A refreshed key is re-inserted at the newest end; only a new key can push out the oldest entry.
+        if self._cache.pop(key, None) is None and len(self._cache) >= GET_CACHE_MAXSIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + self.cache_ttl, fetch.result())
+
     async def request(
         self,
         method: str,
         endpoint: str,
         json_data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
-        """Make an HTTP request with opinionated error handling."""
-        client = await self._get_client()
+        model: type[BaseModel] | None = None,
+        stale_ttl: float = 0.0,
+    ) -> Any:
+        """Make an HTTP request with opinionated error handling.
+
+        When ``model`` is given the raw response bytes are validated straight into
+        that Pydantic model, skipping the intermediate ``dict``. Otherwise the body is
+        decoded with orjson and returned as plain Python data.
+
+        GET bodies are cached for ``cache_ttl`` seconds; any other method clears the
+        cache both before and after it is sent. ``stale_ttl`` lets a GET for rarely
+        changing data serve an expired body for that much longer while it refreshes.
+        """
+        method = method.upper()
         url = endpoint if endpoint.startswith(("http://", "https://")) else f"{self.base_url}/{endpoint.lstrip('/')}"
 
+        if method == "GET" and self.cache_ttl > 0:
+            status_code, body = await self._cached_get(url, params, stale_ttl)
+        elif method in ("GET", "HEAD"):
+            status_code, body = await self._send(method, url, json_data, params)
+        else:
+            self._invalidate_cache()
+            try:
+                status_code, body = await self._send(method, url, json_data, params)
+            finally:
+                self._invalidate_cache()
+        return _decode_body(status_code, body, model)
+
+    async def _send(
+        self, method: str, url: str, json_data: dict[str, Any] | None, params: dict[str, Any] | None
+    ) -> tuple[int, bytes]:
+        """Send a request with retries, returning the status and body of the first 2xx response."""
+        client = await self._get_client()
+        retryable = method in IDEMPOTENT_METHODS
+        # Encoded once with orjson and reused across retries; Content-Type comes from the client headers.
+        content = orjson.dumps(json_data) if json_data is not None else None
+
         for attempt in range(3):  # Retry logic
+            last_attempt = attempt == 2
             try:
                 response = await client.request(
-                    method=method.upper(),
+                    method=method,
                     url=url,
-                    json=json_data,
+                    content=content,
                     params=params,
                 )
-                response.raise_for_status()
-                # Return empty dict for 204 No Content responses
-                return response.json() if response.status_code != 204 else {}
-            except (httpx.RequestError, httpx.HTTPStatusError) as e:
-                if attempt == 2 or (
-                    isinstance(e, httpx.HTTPStatusError)
-                    and 400 <= e.response.status_code < 500
-                    and e.response.status_code != 429
-                ):
-                    if isinstance(e, httpx.HTTPStatusError) and 400 <= e.response.status_code < 500:
-                        logger.warning("API client error for %s: %s", url, e.response.text)
-                        raise CutoverAPIError(
-                            status_code=e.response.status_code,
-                            url=url,
-                            messages=_parse_error_messages(e.response),
-                            raw_body=e.response.text,
-                        ) from e
+            except httpx.RequestError as e:
+                if last_attempt or not (retryable or isinstance(e, CONNECT_ERRORS)):
                     logger.error("API request failed for %s: %s", url, e)
                     raise
-                delay = 2**attempt
-                logger.warning("API error for %s: %s. Retrying in %ss", url, e, delay)
-                await asyncio.sleep(delay)
+                await _backoff(url, e, attempt)
+                continue
+
+            status_code = response.status_code
+            if 200 <= status_code < 300:
+                return status_code, response.content
+
+            is_client_error = 400 <= status_code < 500
+            # A rate-limited request was never processed, so a 429 is retried for every method;
+            # a 5xx may have been applied, so only idempotent methods retry it.
+            should_retry = status_code == 429 if is_client_error else retryable
+            if last_attempt or not should_retry:
+                if is_client_error:
+                    logger.warning("API client error for %s: %s", url, response.text)
+                    raise CutoverAPIError(
+                        status_code=status_code,
+                        url=url,
+                        messages=_parse_error_messages(response),
+                        raw_body=response.text,
+                    )
+                logger.error("API request failed for %s: HTTP %s", url, status_code)
+                raise httpx.HTTPStatusError(
+                    f"HTTP {status_code} {response.reason_phrase} for url '{url}'",
+                    request=response.request,
+                    response=response,
+                )
+            await _backoff(url, f"HTTP {status_code}", attempt)
         raise ConnectionError("API request failed after multiple retries.")  # Should not be reached
 
 
 class APIClientManager:
     """
-    A small pool to manage APIClient instances, keyed by base_url and api_key.
-    This ensures we reuse clients efficiently.
+    Holds the one APIClient built from the environment, so every tool reuses
+    the same client and its connection pool.
     """
 
     def __init__(self):
-        self._clients: dict[str, APIClient] = {}
+        # Resolved on first use rather than here: the singleton below is created at
+        # import time, before load_dotenv() has populated the environment.
+        self._client: APIClient | None = None
 
     def get_client(self) -> APIClient:
-        """Gets a client based on environment variables."""
+        """Gets a client based on environment variables.
+
+        The environment is read once; later calls return the cached client directly.
+        Deliberately synchronous: with no await between the lookup and the assignment,
+        concurrently running tools cannot race to create duplicate clients.
+        """
+        if self._client is not None:
+            return self._client
+
         base_url = os.getenv("CUTOVER_BASE_URL")
         api_key = os.getenv("CUTOVER_API_TOKEN")
         core_url = os.getenv("CUTOVER_CORE_URL")
@@ -158,16 +342,15 @@ class APIClientManager:
         if not base_url or not api_key:
             raise ValueError("CUTOVER_BASE_URL and CUTOVER_API_TOKEN must be set.")
 
-        key = f"{base_url}|{api_key}|{core_url}"
-        if key not in self._clients:
-            self._clients[key] = APIClient(base_url, api_key, core_url=core_url)
-        return self._clients[key]
+        cache_ttl = float(os.getenv("CUTOVER_MCP_CACHE_TTL") or GET_CACHE_TTL)
+        self._client = APIClient(base_url, api_key, core_url=core_url, cache_ttl=cache_ttl)
+        return self._client
 
     async def close_all(self) -> None:
-        """Closes all managed client sessions."""
-        for client in self._clients.values():
-            await client.aclose()
-        self._clients.clear()
+        """Closes the managed client session."""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
 
 
 # Singleton instance used throughout the application
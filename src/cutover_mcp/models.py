@@ -1,22 +1,27 @@
 from __future__ import annotations
 
-import inspect
+import contextlib
+import functools
+import os
+import types
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Any, Generic, Literal, TypeVar, Union, _GenericAlias, get_args, get_origin
+from typing import Annotated, Any, Generic, Literal, TypeVar, Union, get_args, get_origin
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 # --- 1. Generic JSON:API and Helper Models ---
 
 # Type variables for creating generic models
-AttributesType = TypeVar("AttributesType")
-RelationshipsType = TypeVar("RelationshipsType")
 DataType = TypeVar("DataType")
 
 
 class JsonApiIdentifier(BaseModel):
     """A JSON:API resource identifier object."""
 
+    # Identifiers are immutable leaf values repeated across relationship lists.
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     id: str
     type: str
 
@@ -28,13 +33,17 @@ class Relationship(BaseModel, Generic[DataType]):
     links: dict[str, str] | None = None
 
 
-class JsonApiObject(BaseModel, Generic[AttributesType, RelationshipsType]):
-    """A generic JSON:API resource object."""
+class JsonApiObject(BaseModel):
+    """
+    A JSON:API resource object. Concrete resources subclass it and narrow
+    ``type``, ``attributes`` and ``relationships``; it is kept non-generic so
+    each resource is a plain class rather than a parametrized generic.
+    """
 
     id: str
     type: str
-    attributes: AttributesType
-    relationships: RelationshipsType | None = None
+    attributes: Any
+    relationships: Any | None = None
     links: dict[str, str] | None = None
     meta: dict[str, Any] | None = None
 
@@ -62,19 +71,27 @@ class ResponseMeta(BaseModel):
     page: PageMeta
 
 
-class JsonApiListResponse(BaseModel, Generic[DataType]):
-    """A generic model for a JSON:API list response."""
+class JsonApiListResponse(BaseModel):
+    """Base model for a JSON:API list response; concrete responses narrow ``data``."""
 
-    data: list[DataType]
+    data: list[JsonApiObject]
     meta: ResponseMeta
     links: PaginationLinks
     included: list[JsonApiObject] | None = []
 
+    _included_index: dict[tuple[str, str], JsonApiObject] | None = PrivateAttr(default=None)
+
+    def get_included(self, type_: str, id_: str) -> JsonApiObject | None:
+        """Look up a sideloaded resource by type and id, indexing ``included`` on first use."""
+        if self._included_index is None:
+            self._included_index = {(obj.type, obj.id): obj for obj in self.included or []}
+        return self._included_index.get((type_, id_))
 
-class JsonApiSingleResponse(BaseModel, Generic[DataType]):
-    """A generic model for a JSON:API single resource response."""
 
-    data: DataType
+class JsonApiSingleResponse(BaseModel):
+    """Base model for a JSON:API single resource response; concrete responses narrow ``data``."""
+
+    data: JsonApiObject
     included: list[JsonApiObject] | None = []
 
 
@@ -133,6 +150,11 @@ class RunbookVersionIdentifier(JsonApiIdentifier):
     type: Literal["runbook_version"]
 
 
+# Tagged on ``type`` so pydantic-core dispatches straight to the matching identifier
+# instead of trying each member of the union in turn.
+AssigneeIdentifier = Annotated[UserIdentifier | RunbookTeamIdentifier, Field(discriminator="type")]
+
+
 # --- 3. Action Log Models ---
 
 
@@ -149,13 +171,19 @@ class ActionLogRelationships(BaseModel):
     context: Relationship[GenericResourceIdentifier] | None = None
 
 
-class ActionLogResource(JsonApiObject[ActionLogAttributes, ActionLogRelationships]):
+class ActionLogResource(JsonApiObject):
     type: Literal["action_log"]
+    attributes: ActionLogAttributes
+    relationships: ActionLogRelationships | None = None
 
 
 # Final Action Log Response Models
-ActionLogResponse = JsonApiSingleResponse[ActionLogResource]
-ActionLogListResponse = JsonApiListResponse[ActionLogResource]
+class ActionLogResponse(JsonApiSingleResponse):
+    data: ActionLogResource
+
+
+class ActionLogListResponse(JsonApiListResponse):
+    data: list[ActionLogResource]
 
 
 # --- 4. Task Models ---
@@ -163,13 +191,15 @@ ActionLogListResponse = JsonApiListResponse[ActionLogResource]
 
 class CustomFieldValue(BaseModel):
     name: str | None = None
-    custom_field_id: str | None = Field(None, alias="custom_field_id")
+    custom_field_id: str | None = None
     value: str | list[str] | None
-    display_name: str | None = Field(None, alias="display_name")
-    read_only: bool | None = Field(None, alias="read_only")
+    display_name: str | None = None
+    read_only: bool | None = None
 
 
 class TaskAttributes(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     name: str | None = None
     description: str | None = None
     duration: int | None = None
@@ -184,27 +214,41 @@ class TaskAttributes(BaseModel):
     end_display: datetime | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
-    custom_field_values: list[CustomFieldValue] | None = Field(None, alias="custom_field_values")
-    comments_count: int | None = Field(None, alias="comments_count")
+    custom_field_values: list[CustomFieldValue] | None = None
+    comments_count: int | None = None
     task_links: list[TaskLinkResponse] | None = None
 
 
 class TaskRelationships(BaseModel):
     stream: Relationship[StreamIdentifier] | None = None
-    task_type: Relationship[TaskTypeIdentifier] | None = Field(None, alias="task_type")
-    assignees: Relationship[list[UserIdentifier | RunbookTeamIdentifier]] | None = None
+    task_type: Relationship[TaskTypeIdentifier] | None = None
+    assignees: Relationship[list[AssigneeIdentifier]] | None = None
     predecessors: Relationship[list[TaskIdentifier]] | None = None
     successors: Relationship[list[TaskIdentifier]] | None = None
-    runbook_version: Relationship[RunbookVersionIdentifier] | None = Field(None, alias="runbook_version")
+    runbook_version: Relationship[RunbookVersionIdentifier] | None = None
 
 
-class TaskResource(JsonApiObject[TaskAttributes, TaskRelationships]):
+class TaskResource(JsonApiObject):
     type: Literal["task"]
+    attributes: TaskAttributes
+    relationships: TaskRelationships | None = None
 
 
 # Final Task Response Models
-TaskResponse = JsonApiSingleResponse[TaskResource]
-TaskListResponse = JsonApiListResponse[TaskResource]
+class TaskResponse(JsonApiSingleResponse):
+    data: TaskResource
+
+
+class TaskListResponse(JsonApiListResponse):
+    data: list[TaskResource]
+
+
+class TaskListPage(BaseModel):
+    """One page of a paginated task list; the API may leave out ``meta`` and ``links``."""
+
+    data: list[TaskResource]
+    meta: ResponseMeta | None = None
+    links: PaginationLinks | None = None
 
 
 # --- 5. Stream Models ---
@@ -214,34 +258,40 @@ class StreamAttributes(BaseModel):
     name: str
     description: str | None = None
     color: str | None = None
-    is_primary: bool | None = Field(None, alias="is_primary")
+    is_primary: bool | None = None
     status: Literal["off", "red", "amber", "green"] | None = None
-    status_message: str | None = Field(None, alias="status_message")
-    status_updated_at: datetime | None = Field(None, alias="status_updated_at")
-    start_planned: datetime | None = Field(None, alias="start_planned")
-    end_planned: datetime | None = Field(None, alias="end_planned")
-    start_latest_planned: datetime | None = Field(None, alias="start_latest_planned")
-    end_latest_planned: datetime | None = Field(None, alias="end_latest_planned")
-    start_display: datetime | None = Field(None, alias="start_display")
-    end_display: datetime | None = Field(None, alias="end_display")
-    created_at: datetime | None = Field(None, alias="created_at")
-    updated_at: datetime | None = Field(None, alias="updated_at")
-    tasks_count: int | None = Field(None, alias="tasks_count")
+    status_message: str | None = None
+    status_updated_at: datetime | None = None
+    start_planned: datetime | None = None
+    end_planned: datetime | None = None
+    start_latest_planned: datetime | None = None
+    end_latest_planned: datetime | None = None
+    start_display: datetime | None = None
+    end_display: datetime | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    tasks_count: int | None = None
 
 
 class StreamRelationships(BaseModel):
     parent: Relationship[StreamIdentifier] | None = None
-    runbook_version: Relationship[RunbookVersionIdentifier] | None = Field(None, alias="runbook_version")
-    status_author: Relationship[UserIdentifier] | None = Field(None, alias="status_author")
+    runbook_version: Relationship[RunbookVersionIdentifier] | None = None
+    status_author: Relationship[UserIdentifier] | None = None
 
 
-class StreamResource(JsonApiObject[StreamAttributes, StreamRelationships]):
+class StreamResource(JsonApiObject):
     type: Literal["stream"]
+    attributes: StreamAttributes
+    relationships: StreamRelationships | None = None
 
 
 # Final Stream Response Models
-StreamResponse = JsonApiSingleResponse[StreamResource]
-StreamListResponse = JsonApiListResponse[StreamResource]
+class StreamResponse(JsonApiSingleResponse):
+    data: StreamResource
+
+
+class StreamListResponse(JsonApiListResponse):
+    data: list[StreamResource]
 
 
 # --- 6. Runbook Type Models ---
@@ -266,12 +316,15 @@ class RunbookTypeRelationships(BaseModel):
     workspace: Relationship[JsonApiIdentifier] | None = None
 
 
-class RunbookTypeResource(JsonApiObject[RunbookTypeAttributes, RunbookTypeRelationships]):
+class RunbookTypeResource(JsonApiObject):
     type: Literal["runbook_type"]
+    attributes: RunbookTypeAttributes
+    relationships: RunbookTypeRelationships | None = None
 
 
 # Final Runbook Type Response Models
-RunbookTypeListResponse = JsonApiListResponse[RunbookTypeResource]
+class RunbookTypeListResponse(JsonApiListResponse):
+    data: list[RunbookTypeResource]
 
 
 # --- 7. Runbook Models ---
@@ -281,10 +334,10 @@ class RunbookAttributes(BaseModel):
     name: str
     description: str | None = None
     archived: bool = False
-    is_template: bool | None = Field(False, alias="is_template")
+    is_template: bool | None = False
     stage: Literal["planning", "active", "paused", "canceled", "complete"] | None = None
     status: Literal["off", "red", "amber", "green"] | None = None
-    template_type: Literal["off", "default", "snippet"] | None = Field(None, alias="template_type")
+    template_type: Literal["off", "default", "snippet"] | None = None
     rto: int | None = None  # Recovery Time Objective in seconds
     timezone: str | None = None  # IANA timezone name
     start_planned: datetime | None = None
@@ -295,24 +348,30 @@ class RunbookAttributes(BaseModel):
     end_actual: datetime | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
-    custom_field_values: list[CustomFieldValue] | None = Field(None, alias="custom_field_values")
+    custom_field_values: list[CustomFieldValue] | None = None
 
 
 class RunbookRelationships(BaseModel):
     workspace: Relationship[JsonApiIdentifier] | None = None
     folder: Relationship[JsonApiIdentifier] | None = None
-    runbook_type: Relationship[JsonApiIdentifier] | None = Field(None, alias="runbook_type")
+    runbook_type: Relationship[JsonApiIdentifier] | None = None
     author: Relationship[UserIdentifier] | None = None
-    current_version: Relationship[RunbookVersionIdentifier] | None = Field(None, alias="current_version")
+    current_version: Relationship[RunbookVersionIdentifier] | None = None
 
 
-class RunbookResource(JsonApiObject[RunbookAttributes, RunbookRelationships]):
+class RunbookResource(JsonApiObject):
     type: Literal["runbook"]
+    attributes: RunbookAttributes
+    relationships: RunbookRelationships | None = None
 
 
 # Final Runbook Response Models
-RunbookResponse = JsonApiSingleResponse[RunbookResource]
-RunbookListResponse = JsonApiListResponse[RunbookResource]
+class RunbookResponse(JsonApiSingleResponse):
+    data: RunbookResource
+
+
+class RunbookListResponse(JsonApiListResponse):
+    data: list[RunbookResource]
 
 
 # --- 7. Folder Models ---
@@ -334,80 +393,168 @@ class FolderRelationships(BaseModel):
     workspace: Relationship[JsonApiIdentifier] | None = None
 
 
-class FolderResource(JsonApiObject[FolderAttributes, FolderRelationships]):
+class FolderResource(JsonApiObject):
     type: Literal["folder"]
+    attributes: FolderAttributes
+    relationships: FolderRelationships | None = None
 
 
 # Final Folder Response Models
-FolderResponse = JsonApiSingleResponse[FolderResource]
-FolderListResponse = JsonApiListResponse[FolderResource]
-
-
-def generate_compact_schema_text(model: type[BaseModel], indent: int = 0, visited: set | None = None) -> str:
+class FolderResponse(JsonApiSingleResponse):
+    data: FolderResource
+
+
+class FolderListResponse(JsonApiListResponse):
+    data: list[FolderResource]
+
+
+# Resolve every concrete response model at import so any incomplete schema fails fast
+# and the first request after boot never pays for validator construction.
+for _response_model in (
+    ActionLogResponse,
+    ActionLogListResponse,
+    TaskResponse,
+    TaskListResponse,
+    StreamResponse,
+    StreamListResponse,
+    RunbookTypeListResponse,
+    RunbookResponse,
+    RunbookListResponse,
+    FolderResponse,
+    FolderListResponse,
+):
+    _response_model.model_rebuild()
+del _response_model
+
+
+def _is_pydantic_model(obj: Any) -> bool:
+    """Cheap Pydantic v2 model check: one attribute lookup instead of isclass/issubclass reflection."""
+    return hasattr(obj, "__pydantic_core_schema__")
+
+
+def _unwrap_annotated(tp: Any) -> Any:
+    """Strip ``Annotated[...]`` metadata, such as a union discriminator, down to the underlying type."""
+    while get_origin(tp) is Annotated:
+        tp = get_args(tp)[0]
+    return tp
+
+
+def _type_name(tp: Any) -> str:
+    """Readable name for a field type, e.g. ``Relationship[list[UserIdentifier | RunbookTeamIdentifier]]``."""
+    tp = _unwrap_annotated(tp)
+    if tp is type(None):
+        return "None"
+    origin = get_origin(tp)
+    if origin in (Union, types.UnionType):
+        return " | ".join(_type_name(arg) for arg in get_args(tp))
+    if origin is list and get_args(tp):
+        return f"list[{_type_name(get_args(tp)[0])}]"
+    generic = getattr(tp, "__pydantic_generic_metadata__", None)
+    if generic and generic["origin"] is not None:
+        return f"{generic['origin'].__name__}[{', '.join(_type_name(arg) for arg in generic['args'])}]"
+    return getattr(tp, "__name__", str(tp))
+
+
+@functools.cache
+def _schema_layout(model: type[BaseModel]) -> tuple[tuple[str, str, bool, tuple[type[BaseModel], ...]], ...]:
     """
-    Recursively generates a compact, human-readable text representation
-    of a Pydantic model's schema.
+    Resolve each field of a model to ``(name, type_name, is_optional, nested_models)``
+    once, so rendering never repeats the typing reflection for a model.
     """
-    if visited is None:
-        visited = set()
-
-    if model in visited:
-        return f"{' ' * indent}{model.__name__} (circular reference)\n"
-
-    visited.add(model)
-
-    schema_text = ""
+    layout = []
     for field_name, field_info in model.model_fields.items():
-        # Get the type annotation
-        field_type = field_info.annotation
+        # Get the type annotation, without any Annotated metadata
+        field_type = _unwrap_annotated(field_info.annotation)
 
-        # Handle optional types (Union[T, None])
+        # Handle optional types (Optional[T] and T | None)
         is_optional = False
-        if get_origin(field_type) is Union:
+        if get_origin(field_type) in (Union, types.UnionType):
             args = get_args(field_type)
             if len(args) == 2 and type(None) in args:
                 is_optional = True
                 # Get the non-None type
                 field_type = args[0] if args[1] is type(None) else args[1]
 
-        # Handle list types
-        is_list = False
-        if get_origin(field_type) in (list, _GenericAlias) and get_args(field_type):
-            is_list = True
-            list_item_type = get_args(field_type)[0]
-            type_name = f"list[{list_item_type.__name__}]"
-        else:
-            type_name = getattr(field_type, "__name__", str(field_type))
+        # Note the nested Pydantic models to descend into, including list items and union members
+        layout.append((field_name, _type_name(field_type), is_optional, _model_candidates(field_type)))
+    return tuple(layout)
+
+
+def _render_schema(model: type[BaseModel], indent: int, visited: set, out: list[str]) -> None:
+    """
+    Append the schema lines for ``model`` (and its nested models) to ``out``.
+
+    Every nested model (relationships, list items and union members alike) is expanded
+    the first time it appears. A model already expanded elsewhere is shown as
+    "(see above)"; one that contains itself on the current path as "(circular reference)".
+    """
+    # Each frame iterates either a model's fields (tagged with that model, so the stack
+    # doubles as the recursion path) or the nested models of one field (tagged None).
+    stack: list[tuple[Iterator, int, type[BaseModel] | None]] = []
+
+    if model in visited:
+        out.append(f"{' ' * indent}{_type_name(model)} (see above)\n")
+        return
+    visited.add(model)
+    stack.append((iter(_schema_layout(model)), indent, model))
+
+    while stack:
+        items, indent, _ = stack[-1]
+        item = next(items, None)
+        if item is None:
+            stack.pop()
+            continue
+
+        if _is_pydantic_model(item):
+            prefix = f"{' ' * indent}-> {_type_name(item)}"
+            if any(frame_model is item for _, _, frame_model in stack):
+                out.append(f"{prefix} (circular reference)\n")
+            elif item in visited:
+                out.append(f"{prefix} (see above)\n")
+            else:
+                # Add a header for the nested definition; its fields are emitted next
+                out.append(f"{prefix} details:\n")
+                visited.add(item)
+                stack.append((iter(_schema_layout(item)), indent + 2, item))
+            continue
+
+        field_name, type_name, is_optional, nested_models = item
 
         # Build the line for the current field
-        line = f"{' ' * indent}{field_name}: {type_name}"
-        if is_optional:
-            line += " (optional)"
-        schema_text += line + "\n"
+        out.append(f"{' ' * indent}{field_name}: {type_name}{' (optional)' if is_optional else ''}\n")
 
-        # Recurse for nested Pydantic models
-        nested_model = None
-        if is_list:
-            # Check if the items in the list are Pydantic models
-            if inspect.isclass(list_item_type) and issubclass(list_item_type, BaseModel):
-                nested_model = list_item_type
-        elif inspect.isclass(field_type) and issubclass(field_type, BaseModel):
-            nested_model = field_type
+        if nested_models:
+            stack.append((iter(nested_models), indent + 2, None))
 
-        if nested_model:
-            # Add a header for the nested definition and recurse
-            schema_text += f"{' ' * (indent + 2)}-> {nested_model.__name__} details:\n"
-            schema_text += generate_compact_schema_text(nested_model, indent + 4, visited)
 
-    return schema_text
+def generate_compact_schema_text(model: type[BaseModel], indent: int = 0, visited: set | None = None) -> str:
+    """
+    Generates a compact, human-readable text representation of a Pydantic
+    model's schema, walking nested models depth-first with an explicit stack.
+    """
+    out: list[str] = []
+    _render_schema(model, indent, set() if visited is None else visited, out)
+    return "".join(out)
+
+
+@functools.cache
+def _compact_schema(model: type[BaseModel]) -> str:
+    """Rendered schema text per return model, so each model tree is walked once per process."""
+    return generate_compact_schema_text(model)
+
+
+# Compact return schema text per tool name, served on demand by the cutover://schemas/{tool} resource
+# so the always-listed tool descriptions stay short.
+TOOL_SCHEMAS: dict[str, str] = {}
 
 
 def inject_return_schema(func):
     """
-    Dynamically injects a compact, token-efficient text representation of a
-    function's Pydantic return type into its docstring.
+    Registers a compact, token-efficient text representation of a function's
+    Pydantic return type in ``TOOL_SCHEMAS``.
 
-    It replaces the placeholder '{return_schema}' with the compact schema.
+    It replaces the placeholder '{return_schema}' in the docstring with the URI
+    of the resource that serves the schema.
     """
     if not func.__doc__:
         return func
@@ -422,9 +569,101 @@ def inject_return_schema(func):
         return func
 
     # Check if the annotation is a Pydantic model class
-    if inspect.isclass(return_model) and issubclass(return_model, BaseModel):
-        # Generate the compact schema and replace the placeholder
-        schema_string = generate_compact_schema_text(return_model)
-        func.__doc__ = func.__doc__.replace(placeholder, schema_string)
+    if _is_pydantic_model(return_model):
+        # Generate the compact schema (once per model) and point the docstring at it
+        TOOL_SCHEMAS[func.__name__] = _compact_schema(return_model)
+        func.__doc__ = func.__doc__.replace(placeholder, f"cutover://schemas/{func.__name__}")
 
     return func
+
+
+@functools.cache
+def trust_api_responses() -> bool:
+    """
+    Whether ``CUTOVER_MCP_TRUST_API=1`` opts into building responses without validation.
+    Read on first use rather than at import, after load_dotenv() has run, and cached from then on.
+    """
+    return os.getenv("CUTOVER_MCP_TRUST_API") == "1"
+
+
+def _model_candidates(annotation: Any) -> tuple[type[BaseModel], ...]:
+    """Collect the Pydantic models an annotation can hold, looking through Optional, Union, Annotated and list."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _model_candidates(get_args(annotation)[0])
+    if origin in (Union, types.UnionType, list):
+        return tuple(model for arg in get_args(annotation) for model in _model_candidates(arg))
+    if _is_pydantic_model(annotation):
+        return (annotation,)
+    return ()
+
+
+def _holds_datetime(annotation: Any) -> bool:
+    """Whether an annotation is ``datetime``, looking through Optional, Union and Annotated."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _holds_datetime(get_args(annotation)[0])
+    if origin in (Union, types.UnionType):
+        return any(_holds_datetime(arg) for arg in get_args(annotation))
+    return annotation is datetime
+
+
+@functools.cache
+def _construct_plan(model: type[BaseModel]) -> tuple[tuple[str, str, tuple[type[BaseModel], ...], bool], ...]:
+    """Resolve each field of a model to ``(payload_key, field_name, nested_models, is_datetime)`` once per model."""
+    return tuple(
+        (
+            field_info.alias or field_name,
+            field_name,
+            _model_candidates(field_info.annotation),
+            _holds_datetime(field_info.annotation),
+        )
+        for field_name, field_info in model.model_fields.items()
+    )
+
+
+def _pick_model(candidates: tuple[type[BaseModel], ...], payload: dict[str, Any]) -> type[BaseModel]:
+    """Choose the union member whose ``type`` literal matches the payload, as the discriminator would."""
+    if len(candidates) > 1:
+        for candidate in candidates:
+            type_field = candidate.model_fields.get("type")
+            if type_field is not None and payload.get("type") in get_args(type_field.annotation):
+                return candidate
+    return candidates[0]
+
+
+def _construct_value(candidates: tuple[type[BaseModel], ...], value: Any) -> Any:
+    if isinstance(value, dict):
+        return construct_response(_pick_model(candidates, value), value)
+    if isinstance(value, list):
+        return [_construct_value(candidates, item) for item in value]
+    return value
+
+
+def construct_response[ModelT: BaseModel](model: type[ModelT], payload: dict[str, Any]) -> ModelT:
+    """
+    Build ``model`` from an already-trusted API payload with ``model_construct``,
+    skipping validation at every level. Scalars are kept as decoded, except that ISO
+    timestamps in ``datetime`` fields are parsed so the model serializes without
+    warnings; only use this for payloads from the Cutover API.
+    """
+    values = {}
+    for key, field_name, candidates, is_datetime in _construct_plan(model):
+        if key not in payload:
+            continue
+        value = payload[key]
+        if candidates:
+            value = _construct_value(candidates, value)
+        elif is_datetime and isinstance(value, str):
+            # A timestamp fromisoformat cannot read is left as sent rather than failing the response.
+            with contextlib.suppress(ValueError):
+                value = datetime.fromisoformat(value)
+        values[field_name] = value
+    return model.model_construct(**values)
+
+
+def build_response[ModelT: BaseModel](model: type[ModelT], payload: dict[str, Any]) -> ModelT:
+    """Validate ``payload`` into ``model``, or construct it when the API is trusted."""
+    if trust_api_responses():
+        return construct_response(model, payload)
+    return model.model_validate(payload)
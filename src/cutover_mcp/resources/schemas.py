@@ -0,0 +1,18 @@
+from fastmcp.exceptions import ResourceError
+
+from cutover_mcp.app import mcp
+from cutover_mcp.models import TOOL_SCHEMAS
+
+
+@mcp.resource("cutover://schemas/{tool}")
+def get_tool_return_schema(tool: str) -> str:
+    """
+    Fetch the compact schema of the object returned by a Cutover tool.
+
+    :param tool: The name of the tool, e.g. "get_runbook_tasks".
+    :return: The return schema as indented "field: type" lines.
+    """
+    try:
+        return TOOL_SCHEMAS[tool]
+    except KeyError:
+        raise ResourceError(f"No return schema is registered for tool '{tool}'") from None
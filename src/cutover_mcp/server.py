@@ -23,6 +23,7 @@ from cutover_mcp.tools import (  # noqa: F401
     users,
     workspaces,
 )
+from cutover_mcp.resources import schemas  # noqa: F401
 
 # Load environment variables from .env file first
 load_dotenv()
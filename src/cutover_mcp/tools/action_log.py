@@ -35,18 +35,14 @@ async def get_action_logs(
     client = client_mgr.get_client()
     action_logs: list[dict[str, Any]] = []
 
-    params: dict[str, Any] | None = {}
-
-    if runbook_id:
-        params["runbook_id"] = runbook_id
-    if user_id:
-        params["user_id"] = user_id
-    if workspace_id:
-        params["workspace_id"] = workspace_id
-    if created_after:
-        params["created_after"] = created_after
-    if created_before:
-        params["created_before"] = created_before
+    filters = {
+        "runbook_id": runbook_id,
+        "user_id": user_id,
+        "workspace_id": workspace_id,
+        "created_after": created_after,
+        "created_before": created_before,
+    }
+    params: dict[str, Any] | None = {key: value for key, value in filters.items() if value}
 
     path: str | None = "core/action_logs"
     pages_fetched = 0
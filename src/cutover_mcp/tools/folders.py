@@ -2,7 +2,7 @@ from typing import Any
 
 from cutover_mcp.app import mcp
 from cutover_mcp.clients.api import client_mgr
-from cutover_mcp.models import FolderListResponse, inject_return_schema
+from cutover_mcp.models import FolderListResponse, build_response, inject_return_schema
 
 
 @mcp.tool()
@@ -11,14 +11,11 @@ async def list_folders(workspace_id: str) -> FolderListResponse:
     """
     List all folders in a specific workspace.
 
+    The full return schema is served by the `{return_schema}` resource.
+
     :param workspace_id: The unique identifier for the workspace.
     :return: A FolderListResponse object containing a list of folders.
 
-    JSON Schema of Return Object:
-    ```json
-    {return_schema}
-    ```
-
     """
     client = client_mgr.get_client()
 
@@ -32,10 +29,11 @@ async def list_folders(workspace_id: str) -> FolderListResponse:
         last_response = response
         path = response.get("links", {}).get("next")
 
-    return FolderListResponse(
-        **{
+    return build_response(
+        FolderListResponse,
+        {
             "data": all_data,
             "meta": last_response.get("meta", {"page": {"number": 1, "total": len(all_data)}}),
             "links": last_response.get("links", {"self": f"core/workspaces/{workspace_id}/folders"}),
-        }
+        },
     )
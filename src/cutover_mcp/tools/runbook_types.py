@@ -1,6 +1,6 @@
 from cutover_mcp.app import mcp
 from cutover_mcp.clients.api import client_mgr
-from cutover_mcp.models import RunbookTypeListResponse, inject_return_schema
+from cutover_mcp.models import RunbookTypeListResponse, build_response, inject_return_schema
 
 
 @mcp.tool()
@@ -9,12 +9,9 @@ async def list_runbook_types() -> RunbookTypeListResponse:
     """
     List all runbook types in the instance.
 
-    :return: A RunbookTypeListResponse object containing a list of runbook types.
+    The full return schema is served by the `{return_schema}` resource.
 
-    JSON Schema of Return Object:
-    ```json
-    {return_schema}
-    ```
+    :return: A RunbookTypeListResponse object containing a list of runbook types.
     """
     client = client_mgr.get_client()
     all_data = []
@@ -27,11 +24,12 @@ async def list_runbook_types() -> RunbookTypeListResponse:
         last_response = response
         path = response.get("links", {}).get("next")
 
-    return RunbookTypeListResponse(
-        **{
+    return build_response(
+        RunbookTypeListResponse,
+        {
             "data": all_data,
             "included": last_response.get("included", []),
             "meta": last_response.get("meta", {"page": {"number": 1, "total": len(all_data)}}),
             "links": last_response.get("links", {"self": "core/runbook_types"}),
-        }
+        },
     )
@@ -3,7 +3,18 @@ from urllib.parse import urlencode
 
 from cutover_mcp.app import mcp
 from cutover_mcp.clients.api import client_mgr
-from cutover_mcp.models import RunbookListResponse, RunbookResponse, TaskListResponse, inject_return_schema
+from cutover_mcp.models import (
+    RunbookListResponse,
+    RunbookResponse,
+    TaskListPage,
+    TaskListResponse,
+    TaskResource,
+    build_response,
+    inject_return_schema,
+)
+
+# Lifecycle actions accepted by manage_runbook; each maps to core/runbooks/{id}/{action}.
+RUNBOOK_ACTIONS = ("start", "cancel", "pause", "resume")
 
 
 @mcp.tool()
@@ -12,17 +23,13 @@ async def get_runbook_by_id(runbook_id: str) -> RunbookResponse:
     """
     Fetch details for a specific runbook by its ID.
 
+    The full return schema is served by the `{return_schema}` resource.
+
     :param runbook_id: The unique identifier for the runbook.
     :return: A RunbookResponse object containing the runbook details.
-
-    JSON Schema of Return Object:
-    ```json
-    {return_schema}
-    ```
     """
     client = client_mgr.get_client()
-    response = await client.request("GET", f"core/runbooks/{runbook_id}")
-    return RunbookResponse(**response)
+    return await client.request("GET", f"core/runbooks/{runbook_id}", model=RunbookResponse)
 
 
 @mcp.tool()
@@ -73,13 +80,14 @@ async def list_runbooks(
         last_response = response
         path = response.get("links", {}).get("next")
 
-    return RunbookListResponse(
-        **{
+    return build_response(
+        RunbookListResponse,
+        {
             "data": all_data,
             "included": last_response.get("included", []),
             "meta": last_response.get("meta", {"page": {"number": 1, "total": len(all_data)}}),
             "links": last_response.get("links", {"self": f"core/runbooks?{urlencode(initial_params)}"}),
-        }
+        },
     )
 
 
@@ -110,6 +118,8 @@ async def get_runbook_tasks(
       pagination or filters, and includes computed timing fields start_display and end_display,
       plus predecessor/successor graph relationships. Use for timeline or dependency views.
 
+    The full return schema is served by the `{return_schema}` resource.
+
     :param runbook_id: The unique identifier for the runbook.
     :param forecast: When true, returns all tasks with computed forecast fields (start_display,
         end_display) and graph info (predecessors, successors). Overrides pagination and filters.
@@ -134,11 +144,6 @@ async def get_runbook_tasks(
     :param sort: Sort order. Example: start_planned or -start_planned (descending).
     :return: A TaskListResponse object containing a list of tasks for the specified runbook.
 
-    JSON Schema of Return Object:
-    ```json
-    {return_schema}
-    ```
-
     """
     client = client_mgr.get_client()
 
@@ -172,27 +177,28 @@ async def get_runbook_tasks(
 
     # Forecast mode returns all tasks in a single response — no pagination needed
     if forecast:
-        response = await client.request("GET", f"core/runbooks/{runbook_id}/tasks", params=params or None)
-        return TaskListResponse(**response)
+        return await client.request(
+            "GET", f"core/runbooks/{runbook_id}/tasks", params=params or None, model=TaskListResponse
+        )
 
-    path: str | None = f"core/runbooks/{runbook_id}/tasks"
-    all_data: list[dict[str, Any]] = []
-    last_response: dict[str, Any] = {}
+    # Each page is validated straight from its response bytes and only the typed tasks are
+    # kept, so no page is ever held as a plain dict.
+    path: str = f"core/runbooks/{runbook_id}/tasks"
+    tasks: list[TaskResource] = []
 
-    while path:
-        response = await client.request("GET", path, params=params)
+    while True:
+        page = await client.request("GET", path, params=params, model=TaskListPage)
         params = None
-        all_data.extend(response.get("data", []))
-        last_response = response
-        path = response.get("links", {}).get("next")
-
-    return TaskListResponse(
-        **{
-            "data": all_data,
-            "meta": last_response.get("meta", {"page": {"number": 1, "total": len(all_data)}}),
-            "links": last_response.get("links", {"self": f"core/runbooks/{runbook_id}/tasks"}),
-        }
-    )
+        tasks.extend(page.data)
+        if page.links is None or not page.links.next:
+            return TaskListResponse.model_validate(
+                {
+                    "data": tasks,
+                    "meta": page.meta or {"page": {"number": 1, "total": len(tasks)}},
+                    "links": page.links or {"self": f"core/runbooks/{runbook_id}/tasks"},
+                }
+            )
+        path = page.links.next
 
 
 @mcp.tool()
@@ -258,8 +264,7 @@ async def update_runbook(
     if relationships:
         payload["data"]["relationships"] = relationships
 
-    response = await client.request("PATCH", f"core/runbooks/{runbook_id}", json_data=payload)
-    return RunbookResponse(**response)
+    return await client.request("PATCH", f"core/runbooks/{runbook_id}", json_data=payload, model=RunbookResponse)
 
 
 @mcp.tool()
@@ -325,8 +330,7 @@ async def create_runbook(
             "relationships": relationships,
         }
     }
-    response = await client.request("POST", "core/runbooks", json_data=payload)
-    return RunbookResponse(**response)
+    return await client.request("POST", "core/runbooks", json_data=payload, model=RunbookResponse)
 
 
 @mcp.tool()
@@ -362,42 +366,26 @@ async def manage_runbook(
     """
     client = client_mgr.get_client()
 
-    # Define the endpoint based on the action
-    endpoint_map = {
-        "start": f"core/runbooks/{runbook_id}/start",
-        "cancel": f"core/runbooks/{runbook_id}/cancel",
-        "pause": f"core/runbooks/{runbook_id}/pause",
-        "resume": f"core/runbooks/{runbook_id}/resume",
-    }
+    if action not in RUNBOOK_ACTIONS:
+        raise ValueError(f"Invalid action: {action}. Must be one of {list(RUNBOOK_ACTIONS)}.")
 
-    if action not in endpoint_map:
-        raise ValueError(f"Invalid action: {action}. Must be one of {list(endpoint_map.keys())}.")
+    endpoint = f"core/runbooks/{runbook_id}/{action}"
 
-    endpoint = endpoint_map[action]
-
-    # Prepare the payload based on the action
+    # Prepare the meta based on the action
     if action == "start":
-        payload = {
-            "meta": {
-                "comms": comms,
-                "disable_task_notify": disable_task_notify,
-                "run_type": run_type,
-                "rebaseline": rebaseline,
-                "shift_fixed_times": shift_fixed_times,
-                "validation_level": validation_level,
-            }
+        meta = {
+            "comms": comms,
+            "disable_task_notify": disable_task_notify,
+            "run_type": run_type,
+            "rebaseline": rebaseline,
+            "shift_fixed_times": shift_fixed_times,
+            "validation_level": validation_level,
         }
     else:
-        payload = {
-            "meta": {
-                "message": message,
-                "notify": notify,
-            }
-        }
+        meta = {"message": message, "notify": notify}
 
     # Remove keys with None values to avoid sending unnecessary fields
-    if "meta" in payload:
-        payload["meta"] = {k: v for k, v in payload["meta"].items() if v is not None}
+    payload = {"meta": {k: v for k, v in meta.items() if v is not None}}
 
     return await client.request("PATCH", endpoint, json_data=payload)
 
@@ -430,4 +418,4 @@ async def get_runbook_template_copies(
         "meta": {"page": {"number": 1, "total": len(all_data)}},
         "links": {"self": f"core/runbooks?source_runbook_id={runbook_id}"},
     }
-    return RunbookListResponse(**final_response)
+    return build_response(RunbookListResponse, final_response)
@@ -11,20 +11,16 @@ async def list_streams(runbook_id: str, forecast: bool = False) -> StreamListRes
     """
     List all streams for a specific runbook, including substreams.
 
+    The full return schema is served by the `{return_schema}` resource.
+
     :param runbook_id: The ID of the runbook to list streams for.
     :param forecast: If true, returns computed forecast fields (start_display, end_display, etc.).
     :return: A StreamListResponse object containing a list of streams.
 
-    JSON Schema of Return Object:
-    ```json
-    {return_schema}
-    ```
-
     """
     client = client_mgr.get_client()
     params = {"forecast": "true"} if forecast else {}
-    response = await client.request("GET", f"core/runbooks/{runbook_id}/streams", params=params)
-    return StreamListResponse(**response)
+    return await client.request("GET", f"core/runbooks/{runbook_id}/streams", params=params, model=StreamListResponse)
 
 
 @mcp.tool()
@@ -39,6 +35,8 @@ async def create_stream(
     """
     Create a new stream or substream in a runbook.
 
+    The full return schema is served by the `{return_schema}` resource.
+
     :param runbook_id: The ID of the runbook to create the stream in.
     :param name: The name of the new stream.
     :param description: An optional description for the stream.
@@ -46,11 +44,6 @@ async def create_stream(
     :param parent_stream_id: The ID of the parent stream if creating a substream.
     :return: A StreamResponse object representing the newly created stream.
 
-    JSON Schema of Return Object:
-    ```json
-    {return_schema}
-    ```
-
     """
     client = client_mgr.get_client()
     attributes = {"name": name}
@@ -64,8 +57,7 @@ async def create_stream(
     if parent_stream_id is not None:
         payload["data"]["relationships"] = {"parent": {"data": {"id": parent_stream_id, "type": "stream"}}}
 
-    response = await client.request("POST", f"core/runbooks/{runbook_id}/streams", json_data=payload)
-    return StreamResponse(**response)
+    return await client.request("POST", f"core/runbooks/{runbook_id}/streams", json_data=payload, model=StreamResponse)
 
 
 @mcp.tool()
@@ -74,19 +66,15 @@ async def get_stream(runbook_id: str, stream_id: str) -> StreamResponse:
     """
     Get details of a specific stream or substream in a runbook.
 
+    The full return schema is served by the `{return_schema}` resource.
+
     :param runbook_id: The ID of the runbook containing the stream.
     :param stream_id: The ID of the stream to retrieve.
     :return: A StreamResponse object representing the stream.
 
-    JSON Schema of Return Object:
-    ```json
-    {return_schema}
-    ```
-
     """
     client = client_mgr.get_client()
-    response = await client.request("GET", f"core/runbooks/{runbook_id}/streams/{stream_id}")
-    return StreamResponse(**response)
+    return await client.request("GET", f"core/runbooks/{runbook_id}/streams/{stream_id}", model=StreamResponse)
 
 
 @mcp.tool()
@@ -101,6 +89,8 @@ async def update_stream(
     """
     Update an existing stream in a runbook.
 
+    The full return schema is served by the `{return_schema}` resource.
+
     :param runbook_id: The ID of the runbook containing the stream.
     :param stream_id: The ID of the stream to update.
     :param name: The new name for the stream.
@@ -108,11 +98,6 @@ async def update_stream(
     :param color: The new color for the stream in CSS-friendly format.
     :return: A StreamResponse object representing the updated stream.
 
-    JSON Schema of Return Object:
-    ```json
-    {return_schema}
-    ```
-
     """
     client = client_mgr.get_client()
     attributes = {}
@@ -125,8 +110,9 @@ async def update_stream(
 
     payload = {"data": {"type": "stream", "id": stream_id, "attributes": attributes}}
 
-    response = await client.request("PATCH", f"core/runbooks/{runbook_id}/streams/{stream_id}", json_data=payload)
-    return StreamResponse(**response)
+    return await client.request(
+        "PATCH", f"core/runbooks/{runbook_id}/streams/{stream_id}", json_data=payload, model=StreamResponse
+    )
 
 
 @mcp.tool()
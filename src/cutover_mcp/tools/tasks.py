@@ -20,6 +20,8 @@ async def add_task_to_runbook(
     """
     Add a new task to an existing runbook.
 
+    The full return schema is served by the `{return_schema}` resource.
+
     :param runbook_id: The ID of the runbook to add the task to.
     :param name: The name of the new task.
     :param description: An optional description for the task.
@@ -37,11 +39,6 @@ async def add_task_to_runbook(
         snippets.
     :return: A TaskResponse object representing the newly created task.
 
-    JSON Schema of Return Object:
-    ```json
-    {return_schema}
-    ```
-
     """
     client = client_mgr.get_client()
     attributes = {"name": name, "description": description}
@@ -67,8 +64,7 @@ async def add_task_to_runbook(
     if relationships:
         payload["data"]["relationships"] = relationships
 
-    response = await client.request("POST", f"core/runbooks/{runbook_id}/tasks", json_data=payload)
-    return TaskResponse(**response)
+    return await client.request("POST", f"core/runbooks/{runbook_id}/tasks", json_data=payload, model=TaskResponse)
 
 
 @mcp.tool()
@@ -90,6 +86,8 @@ async def update_runbook_task(
     """
     Update an existing task in a runbook (including dependencies, description, stream, duration, etc.).
 
+    The full return schema is served by the `{return_schema}` resource.
+
     :param runbook_id: The ID of the runbook containing the task.
     :param task_id: The ID of the task to update.
     :param name: The new name for the task.
@@ -111,11 +109,6 @@ async def update_runbook_task(
         a task to a template runbook — the target must be a template runbook and must have ≥1 task. Use
         ``link_type="snippet"`` to attach one or more snippets. Pass an empty list to clear all links.
     :return: A TaskResponse object representing the updated task.
-
-    JSON Schema of Return Object:
-    ```json
-    {return_schema}
-    ```
     """
     client = client_mgr.get_client()
     attributes: dict = {}
@@ -151,8 +144,15 @@ async def update_runbook_task(
     if relationships:
         payload["data"]["relationships"] = relationships
 
-    response = await client.request("PATCH", f"core/runbooks/{runbook_id}/tasks/{task_id}", json_data=payload)
-    return TaskResponse(**response)
+    return await client.request(
+        "PATCH", f"core/runbooks/{runbook_id}/tasks/{task_id}", json_data=payload, model=TaskResponse
+    )
+
+
+async def _transition_task(runbook_id: str, task_id: str, action: str) -> TaskResponse:
+    """PATCH a task lifecycle endpoint (e.g. start, finish) and return the updated task."""
+    client = client_mgr.get_client()
+    return await client.request("PATCH", f"core/runbooks/{runbook_id}/tasks/{task_id}/{action}", model=TaskResponse)
 
 
 @mcp.tool()
@@ -164,9 +164,7 @@ async def start_task(runbook_id: str, task_id: str) -> TaskResponse:
     :param task_id: The ID of the task to start.
     :return: A TaskResponse object representing the started task.
     """
-    client = client_mgr.get_client()
-    response = await client.request("PATCH", f"core/runbooks/{runbook_id}/tasks/{task_id}/start")
-    return TaskResponse(**response)
+    return await _transition_task(runbook_id, task_id, "start")
 
 
 @mcp.tool()
@@ -178,9 +176,7 @@ async def complete_task(runbook_id: str, task_id: str) -> TaskResponse:
     :param task_id: The ID of the task to complete.
     :return: A TaskResponse object representing the completed task.
     """
-    client = client_mgr.get_client()
-    response = await client.request("PATCH", f"core/runbooks/{runbook_id}/tasks/{task_id}/finish")
-    return TaskResponse(**response)
+    return await _transition_task(runbook_id, task_id, "finish")
 
 
 @mcp.tool()
@@ -3,6 +3,10 @@ from typing import Any
 from cutover_mcp.app import mcp
 from cutover_mcp.clients.api import client_mgr
 
+# Workspace metadata rarely changes, so reads may serve an expired cached copy for this
+# many seconds while it is refreshed in the background.
+WORKSPACE_STALE_TTL = 60.0
+
 
 @mcp.tool()
 async def get_workspace_by_id(workspace_id: str) -> dict[str, Any]:
@@ -13,7 +17,7 @@ async def get_workspace_by_id(workspace_id: str) -> dict[str, Any]:
     :return: A dictionary containing the workspace details.
     """
     client = client_mgr.get_client()
-    return await client.request("GET", f"core/workspaces/{workspace_id}")
+    return await client.request("GET", f"core/workspaces/{workspace_id}", stale_ttl=WORKSPACE_STALE_TTL)
 
 
 @mcp.tool()
@@ -26,7 +30,7 @@ async def query_workspaces(query: str) -> dict[str, Any]:
     """
     client = client_mgr.get_client()
     params = {"query": query}
-    return await client.request("GET", "core/workspaces", params=params)
+    return await client.request("GET", "core/workspaces", params=params, stale_ttl=WORKSPACE_STALE_TTL)
 
 
 @mcp.tool()
@@ -40,7 +44,7 @@ async def list_workspaces(limit: int = 50, offset: int = 0) -> dict:
     """
     client = client_mgr.get_client()
     params = {"page[limit]": limit, "page[offset]": offset}
-    return await client.request("GET", "core/workspaces", params=params)
+    return await client.request("GET", "core/workspaces", params=params, stale_ttl=WORKSPACE_STALE_TTL)
 
 
 @mcp.tool()
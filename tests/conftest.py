@@ -1,33 +1,26 @@
-import os
-from unittest.mock import AsyncMock, patch
+from unittest.mock import create_autospec
 
 import pytest
 
+from cutover_mcp.clients.api import APIClient
+
 
 @pytest.fixture
-def mock_env():
+def mock_env(monkeypatch):
     """Set up test environment variables."""
-    original_env = os.environ.copy()
-    os.environ["CUTOVER_BASE_URL"] = "https://test.cutover.com"
-    os.environ["CUTOVER_API_TOKEN"] = "test-token-123"
-
-    yield
+    monkeypatch.setenv("CUTOVER_BASE_URL", "https://test.cutover.com")
+    monkeypatch.setenv("CUTOVER_API_TOKEN", "test-token-123")
 
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_client():
-    """Provide a mocked API client."""
-    client = AsyncMock()
-    client.request = AsyncMock()
-    return client
+    """Provide a mocked API client that checks call signatures, built once and shared by the whole session."""
+    return create_autospec(APIClient, instance=True)
 
 
 @pytest.fixture
-def mock_client_manager(mock_api_client):
-    """Provide a mocked API client manager."""
-    with patch("cutover_mcp.clients.api.client_mgr.get_client", return_value=mock_api_client):
-        yield mock_api_client
+def mock_client_manager(mock_api_client, monkeypatch):
+    """Provide a mocked API client manager with the shared client reset for this test."""
+    mock_api_client.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("cutover_mcp.clients.api.client_mgr.get_client", lambda: mock_api_client)
+    return mock_api_client
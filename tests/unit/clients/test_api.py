@@ -1,8 +1,13 @@
+import asyncio
+from types import SimpleNamespace
+
 import httpx
+import orjson
 import pytest
 import respx
 
-from cutover_mcp.clients.api import APIClient, CutoverAPIError
+from cutover_mcp.clients.api import APIClient, APIClientManager, CutoverAPIError
+from cutover_mcp.models import RunbookResponse
 
 
 @pytest.mark.asyncio
@@ -62,6 +67,60 @@ async def test_5xx_still_raises_bare_http_status_error(monkeypatch):
     await client.aclose()
 
 
+@pytest.mark.asyncio
+async def test_non_idempotent_request_is_not_retried(monkeypatch):
+    """A POST that fails with a 5xx is raised immediately; replaying it could
+    create the resource twice."""
+    client = APIClient(base_url="https://api.example.com", api_key="token")
+
+    async def no_sleep(_delay):
+        return None
+
+    monkeypatch.setattr("cutover_mcp.clients.api.asyncio.sleep", no_sleep)
+
+    with respx.mock(base_url="https://api.example.com") as mock:
+        route = mock.post("/widgets").mock(return_value=httpx.Response(503, json={"error": "service unavailable"}))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.request("POST", "widgets", json_data={"name": "widget"})
+
+    assert route.call_count == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_is_retried_for_every_method(monkeypatch):
+    """Nothing is sent when the connection fails, so even a POST is retried."""
+    client = APIClient(base_url="https://api.example.com", api_key="token")
+
+    async def no_sleep(_delay):
+        return None
+
+    monkeypatch.setattr("cutover_mcp.clients.api.asyncio.sleep", no_sleep)
+
+    with respx.mock(base_url="https://api.example.com") as mock:
+        route = mock.post("/widgets").mock(
+            side_effect=[httpx.ConnectError("connection refused"), httpx.Response(201, json={"id": "1"})]
+        )
+
+        assert await client.request("POST", "widgets", json_data={"name": "widget"}) == {"id": "1"}
+
+    assert route.call_count == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_client_honours_proxy_environment(monkeypatch):
+    """HTTP(S)_PROXY from the environment is still mounted on the pooled client."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+    client = APIClient(base_url="https://api.example.com", api_key="token")
+
+    http_client = await client._get_client()
+
+    assert http_client._mounts
+    await client.aclose()
+
+
 @pytest.mark.asyncio
 async def test_retryable_429_eventually_raises_cutover_api_error(monkeypatch):
     """429 is retried, but once retries are exhausted it's still a 4xx so it's
@@ -83,3 +142,217 @@ async def test_retryable_429_eventually_raises_cutover_api_error(monkeypatch):
     assert exc_info.value.status_code == 429
     assert exc_info.value.messages == ["rate limited"]
     await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_post_is_retried(monkeypatch):
+    """A 429 means the request was not processed, so even a POST is retried with backoff."""
+    client = APIClient(base_url="https://api.example.com", api_key="token")
+    delays = []
+
+    async def record_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("cutover_mcp.clients.api.asyncio.sleep", record_sleep)
+
+    with respx.mock(base_url="https://api.example.com") as mock:
+        route = mock.post("/widgets").mock(
+            side_effect=[
+                httpx.Response(429, json={"errors": ["rate limited"]}),
+                httpx.Response(201, json={"id": "1"}),
+            ]
+        )
+
+        assert await client.request("POST", "widgets", json_data={"name": "widget"}) == {"id": "1"}
+
+    assert route.call_count == 2
+    assert len(delays) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_request_validates_body_into_model():
+    """Passing ``model`` validates the raw response bytes straight into that model."""
+    client = APIClient(base_url="https://api.example.com", api_key="token")
+
+    with respx.mock(base_url="https://api.example.com") as mock:
+        mock.get("/core/runbooks/rb1").mock(
+            return_value=httpx.Response(
+                200, json={"data": {"id": "rb1", "type": "runbook", "attributes": {"name": "Runbook 1"}}}
+            )
+        )
+
+        result = await client.request("GET", "core/runbooks/rb1", model=RunbookResponse)
+
+    assert isinstance(result, RunbookResponse)
+    assert result.data.attributes.name == "Runbook 1"
+    await client.aclose()
+
+
+def test_client_manager_reads_environment_once(monkeypatch):
+    """The environment is resolved on first use and the client is reused afterwards."""
+    monkeypatch.setenv("CUTOVER_BASE_URL", "https://api.example.com")
+    monkeypatch.setenv("CUTOVER_API_TOKEN", "token")
+    manager = APIClientManager()
+
+    client = manager.get_client()
+    monkeypatch.setenv("CUTOVER_BASE_URL", "https://other.example.com")
+
+    assert manager.get_client() is client
+    assert client.base_url == "https://api.example.com"
+
+
+@pytest.mark.asyncio
+async def test_client_manager_close_all_drops_the_client(monkeypatch):
+    """After close_all the next get_client builds a fresh client."""
+    monkeypatch.setenv("CUTOVER_BASE_URL", "https://api.example.com")
+    monkeypatch.setenv("CUTOVER_API_TOKEN", "token")
+    manager = APIClientManager()
+    client = manager.get_client()
+
+    await manager.close_all()
+
+    assert manager.get_client() is not client
+
+
+@pytest.mark.asyncio
+async def test_request_body_is_orjson_encoded():
+    """json_data is sent as orjson-encoded bytes under the client's JSON content type."""
+    client = APIClient(base_url="https://api.example.com", api_key="token")
+    payload = {"runbook": {"name": "Runbook 1"}}
+
+    with respx.mock(base_url="https://api.example.com") as mock:
+        route = mock.post("/widgets").mock(return_value=httpx.Response(201, json={"data": {}}))
+
+        await client.request("POST", "widgets", json_data=payload)
+
+    request = route.calls.last.request
+    assert request.content == orjson.dumps(payload)
+    assert request.headers["Content-Type"] == "application/json"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_repeated_get_is_served_from_cache():
+    """An identical GET within the TTL reuses the cached body instead of hitting the API again."""
+    client = APIClient(base_url="https://api.example.com", api_key="token")
+
+    with respx.mock(base_url="https://api.example.com") as mock:
+        route = mock.get("/widgets/1").mock(return_value=httpx.Response(200, json={"id": "1"}))
+
+        first = await client.request("GET", "widgets/1", params={"a": 1})
+        second = await client.request("GET", "widgets/1", params={"a": 1})
+        await client.request("GET", "widgets/1", params={"a": 2})
+
+    assert first == second == {"id": "1"}
+    assert first is not second
+    assert route.call_count == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_cached_gets():
+    """Any non-GET request clears the cache so the next GET sees the change."""
+    client = APIClient(base_url="https://api.example.com", api_key="token")
+
+    with respx.mock(base_url="https://api.example.com") as mock:
+        get_route = mock.get("/widgets/1").mock(return_value=httpx.Response(200, json={"id": "1"}))
+        mock.patch("/widgets/1").mock(return_value=httpx.Response(200, json={"id": "1"}))
+
+        await client.request("GET", "widgets/1")
+        await client.request("PATCH", "widgets/1", json_data={"name": "renamed"})
+        await client.request("GET", "widgets/1")
+
+    assert get_route.call_count == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request():
+    """Identical GETs issued together are coalesced into a single API call."""
+    client = APIClient(base_url="https://api.example.com", api_key="token")
+
+    with respx.mock(base_url="https://api.example.com") as mock:
+        route = mock.get("/widgets/1").mock(return_value=httpx.Response(200, json={"id": "1"}))
+
+        results = await asyncio.gather(*(client.request("GET", "widgets/1") for _ in range(5)))
+
+    assert results == [{"id": "1"}] * 5
+    assert route.call_count == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stale_get_is_served_while_refreshing(monkeypatch):
+    """Within stale_ttl an expired body is returned at once and refreshed in the background."""
+    now = [1000.0]
+    monkeypatch.setattr("cutover_mcp.clients.api.time", SimpleNamespace(monotonic=lambda: now[0]))
+    client = APIClient(base_url="https://api.example.com", api_key="token", cache_ttl=10)
+
+    with respx.mock(base_url="https://api.example.com") as mock:
+        route = mock.get("/workspaces/1").mock(
+            side_effect=[httpx.Response(200, json={"version": 1}), httpx.Response(200, json={"version": 2})]
+        )
+
+        assert await client.request("GET", "workspaces/1", stale_ttl=60) == {"version": 1}
+        now[0] += 30
+        assert await client.request("GET", "workspaces/1", stale_ttl=60) == {"version": 1}
+        await asyncio.gather(*client._refreshes)
+        assert await client.request("GET", "workspaces/1", stale_ttl=60) == {"version": 2}
+
+    assert route.call_count == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_cancels_background_refreshes(monkeypatch):
+    """Closing the client cancels pending refreshes, and a closed client opens no new session."""
+    now = [1000.0]
+    monkeypatch.setattr("cutover_mcp.clients.api.time", SimpleNamespace(monotonic=lambda: now[0]))
+    client = APIClient(base_url="https://api.example.com", api_key="token", cache_ttl=10)
+    never = asyncio.Event()
+
+    async def hang(request):
+        await never.wait()
+
+    with respx.mock(base_url="https://api.example.com") as mock:
+        mock.get("/workspaces/1").mock(side_effect=[httpx.Response(200, json={"version": 1}), hang])
+
+        await client.request("GET", "workspaces/1", stale_ttl=60)
+        now[0] += 30
+        await client.request("GET", "workspaces/1", stale_ttl=60)
+        (refresh,) = client._refreshes
+        await asyncio.sleep(0)
+
+        await client.aclose()
+
+        assert refresh.cancelled()
+        assert not client._refreshes
+        with pytest.raises(RuntimeError, match="closed"):
+            await client.request("GET", "workspaces/1")
+    assert client._client is None
+
+
+@pytest.mark.asyncio
+async def test_refreshing_a_cached_key_does_not_evict_another(monkeypatch):
+    """At the size limit only a new key evicts the oldest entry; refreshing an existing key does not."""
+    now = [1000.0]
+    monkeypatch.setattr("cutover_mcp.clients.api.time", SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr("cutover_mcp.clients.api.GET_CACHE_MAXSIZE", 2)
+    client = APIClient(base_url="https://api.example.com", api_key="token", cache_ttl=10)
+
+    with respx.mock(base_url="https://api.example.com") as mock:
+        mock.get("/widgets/1").mock(return_value=httpx.Response(200, json={"id": "1"}))
+        mock.get("/widgets/2").mock(return_value=httpx.Response(200, json={"id": "2"}))
+
+        await client.request("GET", "widgets/1")
+        await client.request("GET", "widgets/2")
+        now[0] += 60
+        # widgets/2 is fetched again while the older widgets/1 entry is still held
+        await client.request("GET", "widgets/2")
+
+    assert [url for url, _ in client._cache] == [
+        "https://api.example.com/widgets/1",
+        "https://api.example.com/widgets/2",
+    ]
+    await client.aclose()
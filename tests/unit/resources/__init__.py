@@ -0,0 +1 @@
+# Resources unit tests package
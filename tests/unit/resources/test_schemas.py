@@ -0,0 +1,153 @@
+import pytest
+from fastmcp.exceptions import ResourceError
+from pydantic import BaseModel
+
+from cutover_mcp.app import mcp
+from cutover_mcp.models import TOOL_SCHEMAS, TaskResponse, generate_compact_schema_text
+from cutover_mcp.resources import schemas
+from cutover_mcp.tools import folders, runbook_types, runbooks, streams, tasks  # noqa: F401
+
+# Full rendering of TaskResponse. Every nested model is expanded once; a repeat is
+# shown as "(see above)" so the schema stays bounded.
+TASK_RESPONSE_SCHEMA = """\
+data: TaskResource
+  -> TaskResource details:
+    id: str
+    type: Literal
+    attributes: TaskAttributes
+      -> TaskAttributes details:
+        name: str (optional)
+        description: str (optional)
+        duration: int (optional)
+        stage: Literal (optional)
+        start_planned: datetime (optional)
+        end_planned: datetime (optional)
+        start_actual: datetime (optional)
+        end_actual: datetime (optional)
+        start_fixed: datetime (optional)
+        end_fixed: datetime (optional)
+        start_display: datetime (optional)
+        end_display: datetime (optional)
+        created_at: datetime (optional)
+        updated_at: datetime (optional)
+        custom_field_values: list[CustomFieldValue] (optional)
+          -> CustomFieldValue details:
+            name: str (optional)
+            custom_field_id: str (optional)
+            value: str | list[str] | None
+            display_name: str (optional)
+            read_only: bool (optional)
+        comments_count: int (optional)
+        task_links: list[TaskLinkResponse] (optional)
+          -> TaskLinkResponse details:
+            id: int
+            link_type: Literal
+    relationships: TaskRelationships (optional)
+      -> TaskRelationships details:
+        stream: Relationship[StreamIdentifier] (optional)
+          -> Relationship[StreamIdentifier] details:
+            data: StreamIdentifier (optional)
+              -> StreamIdentifier details:
+                id: str
+                type: Literal
+            links: dict (optional)
+        task_type: Relationship[TaskTypeIdentifier] (optional)
+          -> Relationship[TaskTypeIdentifier] details:
+            data: TaskTypeIdentifier (optional)
+              -> TaskTypeIdentifier details:
+                id: str
+                type: Literal
+            links: dict (optional)
+        assignees: Relationship[list[UserIdentifier | RunbookTeamIdentifier]] (optional)
+          -> Relationship[list[UserIdentifier | RunbookTeamIdentifier]] details:
+            data: list[UserIdentifier | RunbookTeamIdentifier] (optional)
+              -> UserIdentifier details:
+                id: str
+                type: Literal
+              -> RunbookTeamIdentifier details:
+                id: str
+                type: Literal
+            links: dict (optional)
+        predecessors: Relationship[list[TaskIdentifier]] (optional)
+          -> Relationship[list[TaskIdentifier]] details:
+            data: list[TaskIdentifier] (optional)
+              -> TaskIdentifier details:
+                id: str
+                type: Literal
+            links: dict (optional)
+        successors: Relationship[list[TaskIdentifier]] (optional)
+          -> Relationship[list[TaskIdentifier]] (see above)
+        runbook_version: Relationship[RunbookVersionIdentifier] (optional)
+          -> Relationship[RunbookVersionIdentifier] details:
+            data: RunbookVersionIdentifier (optional)
+              -> RunbookVersionIdentifier details:
+                id: str
+                type: Literal
+            links: dict (optional)
+    links: dict (optional)
+    meta: dict (optional)
+included: list[JsonApiObject] (optional)
+  -> JsonApiObject details:
+    id: str
+    type: str
+    attributes: Any
+    relationships: Any (optional)
+    links: dict (optional)
+    meta: dict (optional)
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tool", sorted(TOOL_SCHEMAS))
+async def test_tool_description_points_at_schema_resource(tool):
+    """The listed tool description references the schema resource instead of embedding the schema."""
+    description = (await mcp.get_tool(tool)).description
+
+    assert f"cutover://schemas/{tool}" in description
+    assert "{return_schema}" not in description
+
+
+def test_get_tool_return_schema():
+    """The resource serves the compact schema registered for the tool."""
+    schema = schemas.get_tool_return_schema("list_streams")
+
+    assert "data: list[StreamResource]" in schema
+    assert "-> StreamAttributes details:" in schema
+
+
+def test_get_tool_return_schema_unknown_tool():
+    """Unknown tool names raise a ResourceError."""
+    with pytest.raises(ResourceError, match="no_such_tool"):
+        schemas.get_tool_return_schema("no_such_tool")
+
+
+def test_schema_expands_discriminated_assignees():
+    """The Annotated discriminator on assignees is unwrapped and both identifier types are expanded."""
+    schema = TOOL_SCHEMAS["update_runbook_task"]
+
+    assert "assignees: Relationship[list[UserIdentifier | RunbookTeamIdentifier]] (optional)" in schema
+    assert "data: list[UserIdentifier | RunbookTeamIdentifier] (optional)" in schema
+    assert "-> UserIdentifier details:" in schema
+    assert "-> RunbookTeamIdentifier details:" in schema
+    assert "Annotated" not in schema
+
+
+def test_task_response_schema_snapshot():
+    """The compact TaskResponse schema matches the documented layout."""
+    assert generate_compact_schema_text(TaskResponse) == TASK_RESPONSE_SCHEMA
+
+
+class _Node(BaseModel):
+    name: str
+    children: list["_Node"] | None = None
+
+
+def test_schema_marks_only_true_cycles_as_circular():
+    """A model nested in itself is circular; a model repeated elsewhere is only "see above"."""
+    schema = generate_compact_schema_text(TaskResponse)
+
+    assert "(circular reference)" not in schema
+    assert "-> Relationship[list[TaskIdentifier]] (see above)" in schema
+    assert generate_compact_schema_text(_Node) == (
+        "name: str\nchildren: list[_Node] (optional)\n  -> _Node (circular reference)\n"
+    )
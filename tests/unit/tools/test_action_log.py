@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
 
 import httpx
 import pytest
@@ -349,13 +349,11 @@ async def test_get_action_logs_empty_result(mock_client_manager):
 async def test_get_action_logs_error_handling(mock_client_manager):
     """Test error handling for action logs."""
     # Set up mock to raise an error
-    mock_response = AsyncMock()
-    mock_response.status_code = 403
-    mock_response.text = "Forbidden"
+    mock_response = SimpleNamespace(status_code=403, text="Forbidden")
 
     mock_client_manager.request.side_effect = httpx.HTTPStatusError(
         "Client error '403 Forbidden'",
-        request=AsyncMock(),
+        request=SimpleNamespace(),
         response=mock_response,
     )
 
@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from cutover_mcp.tools import runbooks, streams, task_types
+
+
+@pytest.mark.parametrize(
+    ("call", "status_code", "message", "text"),
+    [
+        (lambda: runbooks.get_runbook_by_id("invalid-rb"), 404, "Client error '404 Not Found'", "Runbook not found"),
+        (
+            lambda: streams.get_stream("rb123", "invalid-stream"),
+            404,
+            "Client error '404 Not Found'",
+            "Stream not found",
+        ),
+        (task_types.list_task_types, 500, "Server error '500 Internal Server Error'", "Internal Server Error"),
+        (task_types.list_task_types, 401, "Client error '401 Unauthorized'", "Unauthorized"),
+    ],
+    ids=["runbook_not_found", "stream_not_found", "task_types_server_error", "task_types_unauthorized"],
+)
+@pytest.mark.asyncio
+async def test_http_errors_propagate(mock_client_manager, call, status_code, message, text):
+    """HTTP errors from the API client reach the caller unchanged."""
+    mock_client_manager.request.side_effect = httpx.HTTPStatusError(
+        message,
+        request=SimpleNamespace(),
+        response=SimpleNamespace(status_code=status_code, text=text),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await call()
+
+    assert exc_info.value.response.status_code == status_code
@@ -1,33 +1,52 @@
-from unittest.mock import AsyncMock
+import warnings
+from datetime import UTC, datetime
 
-import httpx
 import pytest
 
+from cutover_mcp.models import (
+    RunbookAttributes,
+    RunbookResponse,
+    TaskListPage,
+    TaskListResponse,
+    construct_response,
+    trust_api_responses,
+)
 from cutover_mcp.tools import runbooks
 
 
+@pytest.fixture
+def trusted_api(monkeypatch):
+    """Opt into CUTOVER_MCP_TRUST_API=1, resetting the once-read flag around the test."""
+    monkeypatch.setenv("CUTOVER_MCP_TRUST_API", "1")
+    trust_api_responses.cache_clear()
+    yield
+    trust_api_responses.cache_clear()
+
+
 @pytest.mark.asyncio
 async def test_get_runbook_by_id(mock_client_manager):
     """Test fetching a specific runbook."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "rb123",
-            "type": "runbook",
-            "attributes": {
-                "name": "Test Runbook",
-                "description": "A test runbook",
-                "status": "green",
-                "is_template": False,
-            },
+    mock_client_manager.request.return_value = RunbookResponse.model_validate(
+        {
+            "data": {
+                "id": "rb123",
+                "type": "runbook",
+                "attributes": {
+                    "name": "Test Runbook",
+                    "description": "A test runbook",
+                    "status": "green",
+                    "is_template": False,
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     result = await runbooks.get_runbook_by_id("rb123")
 
     # Verify the API call
-    mock_client_manager.request.assert_called_once_with("GET", "core/runbooks/rb123")
+    mock_client_manager.request.assert_called_once_with("GET", "core/runbooks/rb123", model=RunbookResponse)
 
     # Verify the result
     assert result.data.id == "rb123"
@@ -67,6 +86,79 @@ async def test_list_runbooks(mock_client_manager):
     assert result.data[0].attributes.name == "Runbook 1"
 
 
+@pytest.mark.asyncio
+async def test_list_runbooks_included_lookup(mock_client_manager):
+    """Sideloaded resources can be resolved by (type, id) from the list response."""
+    mock_client_manager.request.return_value = {
+        "data": [
+            {
+                "id": "rb1",
+                "type": "runbook",
+                "attributes": {"name": "Runbook 1"},
+                "relationships": {"author": {"data": {"id": "u1", "type": "user"}}},
+            }
+        ],
+        "included": [{"id": "u1", "type": "user", "attributes": {"first_name": "Ada"}}],
+        "meta": {"page": {"number": 1}},
+        "links": {},
+    }
+
+    result = await runbooks.list_runbooks("ws123")
+
+    author = result.data[0].relationships.author.data
+    assert result.get_included(author.type, author.id).attributes == {"first_name": "Ada"}
+    assert result.get_included("user", "missing") is None
+
+
+@pytest.mark.asyncio
+async def test_list_runbooks_trusted_construct(mock_client_manager, trusted_api):
+    """With CUTOVER_MCP_TRUST_API=1 the list response is constructed, nested models included."""
+    mock_client_manager.request.return_value = {
+        "data": [
+            {
+                "id": "rb1",
+                "type": "runbook",
+                "attributes": {"name": "Runbook 1", "created_at": "2024-01-01T00:00:00Z"},
+                "relationships": {"author": {"data": {"id": "u1", "type": "user"}}},
+            }
+        ],
+        "meta": {"page": {"number": 1}},
+        "links": {},
+    }
+
+    result = await runbooks.list_runbooks("ws123")
+
+    runbook = result.data[0]
+    assert isinstance(runbook.attributes, RunbookAttributes)
+    assert runbook.attributes.name == "Runbook 1"
+    # Construction skips validation, but timestamps are still parsed into datetimes
+    assert runbook.attributes.created_at == datetime(2024, 1, 1, tzinfo=UTC)
+    assert runbook.relationships.author.data.id == "u1"
+
+
+@pytest.mark.asyncio
+async def test_trusted_construct_serializes_without_warnings(mock_client_manager, trusted_api):
+    """A constructed response dumps to JSON without Pydantic serializer warnings."""
+    mock_client_manager.request.return_value = {
+        "data": [
+            {
+                "id": "rb1",
+                "type": "runbook",
+                "attributes": {"name": "Runbook 1", "created_at": "2024-01-01T00:00:00Z"},
+            }
+        ],
+        "meta": {"page": {"number": 1}},
+        "links": {},
+    }
+
+    result = await runbooks.list_runbooks("ws123")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        dumped = result.model_dump(mode="json")
+    assert dumped["data"][0]["attributes"]["created_at"] == "2024-01-01T00:00:00Z"
+
+
 @pytest.mark.asyncio
 async def test_list_runbooks_with_filters(mock_client_manager):
     """Test listing runbooks with source_runbook_id and folder_id filters."""
@@ -130,26 +222,30 @@ async def test_list_runbooks_with_pagination(mock_client_manager):
 @pytest.mark.asyncio
 async def test_get_runbook_tasks(mock_client_manager):
     """Test fetching tasks for a runbook with no filters."""
-    mock_client_manager.request.return_value = {
-        "data": [
-            {
-                "id": "task1",
-                "type": "task",
-                "attributes": {"name": "Task 1", "stage": "not_startable"},
-            },
-            {
-                "id": "task2",
-                "type": "task",
-                "attributes": {"name": "Task 2", "stage": "complete"},
-            },
-        ],
-        "meta": {"page": {"number": 1}},
-        "links": {},
-    }
+    mock_client_manager.request.return_value = TaskListPage.model_validate(
+        {
+            "data": [
+                {
+                    "id": "task1",
+                    "type": "task",
+                    "attributes": {"name": "Task 1", "stage": "not_startable"},
+                },
+                {
+                    "id": "task2",
+                    "type": "task",
+                    "attributes": {"name": "Task 2", "stage": "complete"},
+                },
+            ],
+            "meta": {"page": {"number": 1}},
+            "links": {},
+        }
+    )
 
     result = await runbooks.get_runbook_tasks("rb123")
 
-    mock_client_manager.request.assert_called_once_with("GET", "core/runbooks/rb123/tasks", params={})
+    mock_client_manager.request.assert_called_once_with(
+        "GET", "core/runbooks/rb123/tasks", params={}, model=TaskListPage
+    )
 
     assert len(result.data) == 2
     assert result.data[0].attributes.name == "Task 1"
@@ -159,16 +255,18 @@ async def test_get_runbook_tasks(mock_client_manager):
 @pytest.mark.asyncio
 async def test_get_runbook_tasks_with_stage_filter(mock_client_manager):
     """Test fetching tasks filtered by stage."""
-    mock_client_manager.request.return_value = {
-        "data": [{"id": "task1", "type": "task", "attributes": {"name": "Task 1", "stage": "in_progress"}}],
-        "meta": {"page": {"number": 1}},
-        "links": {},
-    }
+    mock_client_manager.request.return_value = TaskListPage.model_validate(
+        {
+            "data": [{"id": "task1", "type": "task", "attributes": {"name": "Task 1", "stage": "in_progress"}}],
+            "meta": {"page": {"number": 1}},
+            "links": {},
+        }
+    )
 
     result = await runbooks.get_runbook_tasks("rb123", stage=["in_progress"])
 
     mock_client_manager.request.assert_called_once_with(
-        "GET", "core/runbooks/rb123/tasks", params={"stage": "in_progress"}
+        "GET", "core/runbooks/rb123/tasks", params={"stage": "in_progress"}, model=TaskListPage
     )
     assert len(result.data) == 1
     assert result.data[0].attributes.stage == "in_progress"
@@ -177,11 +275,13 @@ async def test_get_runbook_tasks_with_stage_filter(mock_client_manager):
 @pytest.mark.asyncio
 async def test_get_runbook_tasks_with_multiple_filters(mock_client_manager):
     """Test fetching tasks with multiple filters combined."""
-    mock_client_manager.request.return_value = {
-        "data": [{"id": "task1", "type": "task", "attributes": {"name": "Deploy"}}],
-        "meta": {"page": {"number": 1}},
-        "links": {},
-    }
+    mock_client_manager.request.return_value = TaskListPage.model_validate(
+        {
+            "data": [{"id": "task1", "type": "task", "attributes": {"name": "Deploy"}}],
+            "meta": {"page": {"number": 1}},
+            "links": {},
+        }
+    )
 
     result = await runbooks.get_runbook_tasks(
         "rb123",
@@ -194,6 +294,7 @@ async def test_get_runbook_tasks_with_multiple_filters(mock_client_manager):
         "GET",
         "core/runbooks/rb123/tasks",
         params={"stage": "startable,in_progress", "stream_id": "stream1", "search_term": "Deploy"},
+        model=TaskListPage,
     )
     assert result.data[0].attributes.name == "Deploy"
 
@@ -201,25 +302,29 @@ async def test_get_runbook_tasks_with_multiple_filters(mock_client_manager):
 @pytest.mark.asyncio
 async def test_get_runbook_tasks_with_forecast(mock_client_manager):
     """Test fetching tasks in forecast mode."""
-    mock_client_manager.request.return_value = {
-        "data": [
-            {
-                "id": "task1",
-                "type": "task",
-                "attributes": {
-                    "name": "Task 1",
-                    "start_display": "2026-04-01T10:00:00Z",
-                    "end_display": "2026-04-01T11:00:00Z",
-                },
-            }
-        ],
-        "meta": {"page": {"number": 1}},
-        "links": {},
-    }
+    mock_client_manager.request.return_value = TaskListResponse.model_validate(
+        {
+            "data": [
+                {
+                    "id": "task1",
+                    "type": "task",
+                    "attributes": {
+                        "name": "Task 1",
+                        "start_display": "2026-04-01T10:00:00Z",
+                        "end_display": "2026-04-01T11:00:00Z",
+                    },
+                }
+            ],
+            "meta": {"page": {"number": 1}},
+            "links": {},
+        }
+    )
 
     result = await runbooks.get_runbook_tasks("rb123", forecast=True)
 
-    mock_client_manager.request.assert_called_once_with("GET", "core/runbooks/rb123/tasks", params={"forecast": "true"})
+    mock_client_manager.request.assert_called_once_with(
+        "GET", "core/runbooks/rb123/tasks", params={"forecast": "true"}, model=TaskListResponse
+    )
     assert len(result.data) == 1
     assert result.data[0].attributes.start_display is not None
     assert result.data[0].attributes.end_display is not None
@@ -229,37 +334,80 @@ async def test_get_runbook_tasks_with_forecast(mock_client_manager):
 async def test_get_runbook_tasks_pagination(mock_client_manager):
     """Test that get_runbook_tasks follows pagination and returns all tasks."""
     mock_client_manager.request.side_effect = [
-        {
-            "data": [{"id": "task1", "type": "task", "attributes": {"name": "Task 1"}}],
-            "meta": {"page": {"number": 1}},
-            "links": {"next": "core/runbooks/rb123/tasks?page[number]=2"},
-        },
-        {
-            "data": [{"id": "task2", "type": "task", "attributes": {"name": "Task 2"}}],
-            "meta": {"page": {"number": 2}},
-            "links": {},
-        },
+        TaskListPage.model_validate(
+            {
+                "data": [{"id": "task1", "type": "task", "attributes": {"name": "Task 1"}}],
+                "meta": {"page": {"number": 1}},
+                "links": {"next": "core/runbooks/rb123/tasks?page[number]=2"},
+            }
+        ),
+        TaskListPage.model_validate(
+            {
+                "data": [{"id": "task2", "type": "task", "attributes": {"name": "Task 2"}}],
+                "meta": {"page": {"number": 2}},
+                "links": {},
+            }
+        ),
     ]
 
     result = await runbooks.get_runbook_tasks("rb123")
 
     assert mock_client_manager.request.call_count == 2
     calls = mock_client_manager.request.call_args_list
-    assert calls[0] == (("GET", "core/runbooks/rb123/tasks"), {"params": {}})
-    assert calls[1] == (("GET", "core/runbooks/rb123/tasks?page[number]=2"), {"params": None})
+    assert calls[0] == (("GET", "core/runbooks/rb123/tasks"), {"params": {}, "model": TaskListPage})
+    assert calls[1] == (
+        ("GET", "core/runbooks/rb123/tasks?page[number]=2"),
+        {"params": None, "model": TaskListPage},
+    )
     assert len(result.data) == 2
     assert result.data[0].id == "task1"
     assert result.data[1].id == "task2"
+    assert result.meta.page.number == 2
+
+
+@pytest.mark.asyncio
+async def test_get_runbook_tasks_constructed_page_without_links(mock_client_manager):
+    """A page built without validation may lack links and meta; it is treated as the last page."""
+    mock_client_manager.request.return_value = construct_response(
+        TaskListPage, {"data": [{"id": "task1", "type": "task", "attributes": {"name": "Task 1"}}]}
+    )
+
+    result = await runbooks.get_runbook_tasks("rb123")
+
+    mock_client_manager.request.assert_called_once_with(
+        "GET", "core/runbooks/rb123/tasks", params={}, model=TaskListPage
+    )
+    assert [task.id for task in result.data] == ["task1"]
+    assert result.links.self == "core/runbooks/rb123/tasks"
+    assert result.meta.page.number == 1
+    assert result.meta.page.total == 1
+
+
+@pytest.mark.asyncio
+async def test_get_runbook_tasks_page_without_meta_or_links(mock_client_manager):
+    """A last page without meta or links gets the default first-page meta and self link."""
+    mock_client_manager.request.return_value = TaskListPage.model_validate(
+        {"data": [{"id": "task1", "type": "task", "attributes": {"name": "Task 1"}}]}
+    )
+
+    result = await runbooks.get_runbook_tasks("rb123")
+
+    assert isinstance(result, TaskListResponse)
+    assert result.meta.page.number == 1
+    assert result.meta.page.total == 1
+    assert result.links.self == "core/runbooks/rb123/tasks"
 
 
 @pytest.mark.asyncio
 async def test_get_runbook_tasks_with_fields_task(mock_client_manager):
     """Test that fields_task list is joined into a comma-separated string for the API."""
-    mock_client_manager.request.return_value = {
-        "data": [{"id": "1", "type": "task", "attributes": {"name": "Task 1", "stage": "startable"}}],
-        "meta": {"page": {"number": 1}},
-        "links": {},
-    }
+    mock_client_manager.request.return_value = TaskListPage.model_validate(
+        {
+            "data": [{"id": "1", "type": "task", "attributes": {"name": "Task 1", "stage": "startable"}}],
+            "meta": {"page": {"number": 1}},
+            "links": {},
+        }
+    )
 
     await runbooks.get_runbook_tasks("rb123", fields_task=["name", "stage", "start_planned"])
 
@@ -267,17 +415,20 @@ async def test_get_runbook_tasks_with_fields_task(mock_client_manager):
         "GET",
         "core/runbooks/rb123/tasks",
         params={"fields[task]": "name,stage,start_planned"},
+        model=TaskListPage,
     )
 
 
 @pytest.mark.asyncio
 async def test_get_runbook_tasks_with_completion_type_level_has_comments_and_sort(mock_client_manager):
     """Test filtering by completion_type, level, has_comments, and sort order."""
-    mock_client_manager.request.return_value = {
-        "data": [],
-        "meta": {"page": {"number": 1}},
-        "links": {},
-    }
+    mock_client_manager.request.return_value = TaskListPage.model_validate(
+        {
+            "data": [],
+            "meta": {"page": {"number": 1}},
+            "links": {},
+        }
+    )
 
     await runbooks.get_runbook_tasks(
         "rb123",
@@ -296,17 +447,20 @@ async def test_get_runbook_tasks_with_completion_type_level_has_comments_and_sor
             "has_comments": "true",
             "sort": "-start_planned",
         },
+        model=TaskListPage,
     )
 
 
 @pytest.mark.asyncio
 async def test_get_runbook_tasks_with_task_type_team_user_and_source_filters(mock_client_manager):
     """Test filtering by task_type_id, runbook_team_id, user_id, and source_runbook_id."""
-    mock_client_manager.request.return_value = {
-        "data": [],
-        "meta": {"page": {"number": 1}},
-        "links": {},
-    }
+    mock_client_manager.request.return_value = TaskListPage.model_validate(
+        {
+            "data": [],
+            "meta": {"page": {"number": 1}},
+            "links": {},
+        }
+    )
 
     await runbooks.get_runbook_tasks(
         "rb123",
@@ -325,28 +479,31 @@ async def test_get_runbook_tasks_with_task_type_team_user_and_source_filters(moc
             "user_id": "u1,u2",
             "source_runbook_id": "rb-template",
         },
+        model=TaskListPage,
     )
 
 
 @pytest.mark.asyncio
 async def test_get_runbook_tasks_forecast_does_not_paginate(mock_client_manager):
     """Test that forecast mode makes exactly one request regardless of links."""
-    mock_client_manager.request.return_value = {
-        "data": [
-            {
-                "id": "1",
-                "type": "task",
-                "attributes": {"start_display": "2026-04-01T10:00:00Z", "end_display": "2026-04-01T11:00:00Z"},
-            },
-            {
-                "id": "2",
-                "type": "task",
-                "attributes": {"start_display": "2026-04-01T11:00:00Z", "end_display": "2026-04-01T12:00:00Z"},
-            },
-        ],
-        "meta": {"page": {"number": 1, "total": None}},
-        "links": {"next": "core/runbooks/rb123/tasks?page[number]=2"},
-    }
+    mock_client_manager.request.return_value = TaskListResponse.model_validate(
+        {
+            "data": [
+                {
+                    "id": "1",
+                    "type": "task",
+                    "attributes": {"start_display": "2026-04-01T10:00:00Z", "end_display": "2026-04-01T11:00:00Z"},
+                },
+                {
+                    "id": "2",
+                    "type": "task",
+                    "attributes": {"start_display": "2026-04-01T11:00:00Z", "end_display": "2026-04-01T12:00:00Z"},
+                },
+            ],
+            "meta": {"page": {"number": 1, "total": None}},
+            "links": {"next": "core/runbooks/rb123/tasks?page[number]=2"},
+        }
+    )
 
     result = await runbooks.get_runbook_tasks("rb123", forecast=True)
 
@@ -358,16 +515,18 @@ async def test_get_runbook_tasks_forecast_does_not_paginate(mock_client_manager)
 async def test_update_runbook_name_only(mock_client_manager):
     """Test updating only the runbook name."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "rb123",
-            "type": "runbook",
-            "attributes": {
-                "name": "Updated Runbook",
-                "description": "Original description",
-            },
+    mock_client_manager.request.return_value = RunbookResponse.model_validate(
+        {
+            "data": {
+                "id": "rb123",
+                "type": "runbook",
+                "attributes": {
+                    "name": "Updated Runbook",
+                    "description": "Original description",
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     result = await runbooks.update_runbook(runbook_id="rb123", name="Updated Runbook")
@@ -383,6 +542,7 @@ async def test_update_runbook_name_only(mock_client_manager):
                 "attributes": {"name": "Updated Runbook"},
             }
         },
+        model=RunbookResponse,
     )
 
     # Verify the result
@@ -393,20 +553,22 @@ async def test_update_runbook_name_only(mock_client_manager):
 async def test_update_runbook_with_rto_tasks(mock_client_manager):
     """Test updating runbook with RTO task relationships."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "rb123",
-            "type": "runbook",
-            "attributes": {
-                "name": "RTO Runbook",
-                "rto": 3600,
-            },
-            "relationships": {
-                "rto_start_task": {"data": {"id": "task1", "type": "task"}},
-                "rto_end_task": {"data": {"id": "task2", "type": "task"}},
-            },
+    mock_client_manager.request.return_value = RunbookResponse.model_validate(
+        {
+            "data": {
+                "id": "rb123",
+                "type": "runbook",
+                "attributes": {
+                    "name": "RTO Runbook",
+                    "rto": 3600,
+                },
+                "relationships": {
+                    "rto_start_task": {"data": {"id": "task1", "type": "task"}},
+                    "rto_end_task": {"data": {"id": "task2", "type": "task"}},
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     result = await runbooks.update_runbook(
@@ -432,6 +594,7 @@ async def test_update_runbook_with_rto_tasks(mock_client_manager):
                 },
             }
         },
+        model=RunbookResponse,
     )
 
     # Verify the result
@@ -442,17 +605,19 @@ async def test_update_runbook_with_rto_tasks(mock_client_manager):
 async def test_create_runbook_minimal(mock_client_manager):
     """Test creating a runbook with minimal parameters."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "new-rb",
-            "type": "runbook",
-            "attributes": {
-                "name": "New Runbook",
-                "description": "",
-            },
-            "relationships": {"workspace": {"data": {"id": "ws123", "type": "workspace"}}},
+    mock_client_manager.request.return_value = RunbookResponse.model_validate(
+        {
+            "data": {
+                "id": "new-rb",
+                "type": "runbook",
+                "attributes": {
+                    "name": "New Runbook",
+                    "description": "",
+                },
+                "relationships": {"workspace": {"data": {"id": "ws123", "type": "workspace"}}},
+            }
         }
-    }
+    )
 
     # Call the function
     result = await runbooks.create_runbook(workspace_id="ws123", name="New Runbook")
@@ -468,6 +633,7 @@ async def test_create_runbook_minimal(mock_client_manager):
                 "relationships": {"workspace": {"data": {"type": "workspace", "id": "ws123"}}},
             }
         },
+        model=RunbookResponse,
     )
 
     # Verify the result
@@ -479,24 +645,26 @@ async def test_create_runbook_minimal(mock_client_manager):
 async def test_create_runbook_full_params(mock_client_manager):
     """Test creating a runbook with all parameters."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "full-rb",
-            "type": "runbook",
-            "attributes": {
-                "name": "Full Runbook",
-                "description": "Complete runbook",
-                "status": "amber",
-                "is_template": True,
-                "rto": 7200,
-                "timezone": "UTC",
-            },
-            "relationships": {
-                "workspace": {"data": {"id": "ws123", "type": "workspace"}},
-                "runbook_type": {"data": {"id": "rt123", "type": "runbook_type"}},
-            },
+    mock_client_manager.request.return_value = RunbookResponse.model_validate(
+        {
+            "data": {
+                "id": "full-rb",
+                "type": "runbook",
+                "attributes": {
+                    "name": "Full Runbook",
+                    "description": "Complete runbook",
+                    "status": "amber",
+                    "is_template": True,
+                    "rto": 7200,
+                    "timezone": "UTC",
+                },
+                "relationships": {
+                    "workspace": {"data": {"id": "ws123", "type": "workspace"}},
+                    "runbook_type": {"data": {"id": "rt123", "type": "runbook_type"}},
+                },
+            }
         }
-    }
+    )
 
     # Call the function with all params
     result = await runbooks.create_runbook(
@@ -528,7 +696,9 @@ async def test_create_runbook_full_params(mock_client_manager):
             },
         }
     }
-    mock_client_manager.request.assert_called_once_with("POST", "core/runbooks", json_data=expected_payload)
+    mock_client_manager.request.assert_called_once_with(
+        "POST", "core/runbooks", json_data=expected_payload, model=RunbookResponse
+    )
 
     # Verify the result
     assert result.data.attributes.is_template is True
@@ -539,19 +709,21 @@ async def test_create_runbook_full_params(mock_client_manager):
 @pytest.mark.asyncio
 async def test_create_runbook_with_template_type(mock_client_manager):
     """Test creating a runbook with template_type set to default."""
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "tmpl-rb",
-            "type": "runbook",
-            "attributes": {
-                "name": "My Template",
-                "description": "",
-                "template_type": "default",
-                "is_template": True,
-            },
-            "relationships": {"workspace": {"data": {"id": "ws123", "type": "workspace"}}},
+    mock_client_manager.request.return_value = RunbookResponse.model_validate(
+        {
+            "data": {
+                "id": "tmpl-rb",
+                "type": "runbook",
+                "attributes": {
+                    "name": "My Template",
+                    "description": "",
+                    "template_type": "default",
+                    "is_template": True,
+                },
+                "relationships": {"workspace": {"data": {"id": "ws123", "type": "workspace"}}},
+            }
         }
-    }
+    )
 
     result = await runbooks.create_runbook(
         workspace_id="ws123",
@@ -569,6 +741,7 @@ async def test_create_runbook_with_template_type(mock_client_manager):
                 "relationships": {"workspace": {"data": {"type": "workspace", "id": "ws123"}}},
             }
         },
+        model=RunbookResponse,
     )
 
     assert result.data.attributes.template_type == "default"
@@ -578,17 +751,19 @@ async def test_create_runbook_with_template_type(mock_client_manager):
 @pytest.mark.asyncio
 async def test_create_runbook_with_folder_id(mock_client_manager):
     """folder_id is sent as a folder relationship in the payload."""
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "foldered-rb",
-            "type": "runbook",
-            "attributes": {"name": "In Folder", "description": ""},
-            "relationships": {
-                "workspace": {"data": {"id": "ws123", "type": "workspace"}},
-                "folder": {"data": {"id": "f42", "type": "folder"}},
-            },
+    mock_client_manager.request.return_value = RunbookResponse.model_validate(
+        {
+            "data": {
+                "id": "foldered-rb",
+                "type": "runbook",
+                "attributes": {"name": "In Folder", "description": ""},
+                "relationships": {
+                    "workspace": {"data": {"id": "ws123", "type": "workspace"}},
+                    "folder": {"data": {"id": "f42", "type": "folder"}},
+                },
+            }
         }
-    }
+    )
 
     await runbooks.create_runbook(workspace_id="ws123", name="In Folder", folder_id="f42")
 
@@ -605,42 +780,45 @@ async def test_create_runbook_with_folder_id(mock_client_manager):
                 },
             }
         },
+        model=RunbookResponse,
     )
 
 
-@pytest.mark.asyncio
-async def test_manage_runbook_start(mock_client_manager):
-    """Test starting a runbook."""
-    # Set up mock response
-    mock_client_manager.request.return_value = {"status": "started"}
-
-    # Call the function
-    result = await runbooks.manage_runbook(
-        runbook_id="rb123",
-        action="start",
-        comms="on",
-        run_type="live",
-        rebaseline=True,
-    )
-
-    # Verify the API call
-    mock_client_manager.request.assert_called_once_with(
-        "PATCH",
-        "core/runbooks/rb123/start",
-        json_data={
-            "meta": {
+@pytest.mark.parametrize(
+    ("action", "kwargs", "expected_meta"),
+    [
+        (
+            "start",
+            {"comms": "on", "run_type": "live", "rebaseline": True},
+            {
                 "comms": "on",
                 "disable_task_notify": False,
                 "run_type": "live",
                 "rebaseline": True,
                 "shift_fixed_times": False,
                 "validation_level": "error",
-            }
-        },
-    )
+            },
+        ),
+        (
+            "cancel",
+            {"message": "Cancelling due to issue", "notify": True},
+            {"message": "Cancelling due to issue", "notify": True},
+        ),
+        ("pause", {"message": "Pausing for review"}, {"message": "Pausing for review", "notify": False}),
+        ("resume", {}, {"notify": False}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_manage_runbook_actions(mock_client_manager, action, kwargs, expected_meta):
+    """Each action PATCHes its own endpoint with only the meta fields that apply to it."""
+    mock_client_manager.request.return_value = {"status": action}
+
+    result = await runbooks.manage_runbook(runbook_id="rb123", action=action, **kwargs)
 
-    # Verify the result
-    assert result["status"] == "started"
+    mock_client_manager.request.assert_called_once_with(
+        "PATCH", f"core/runbooks/rb123/{action}", json_data={"meta": expected_meta}
+    )
+    assert result["status"] == action
 
 
 @pytest.mark.asyncio
@@ -669,74 +847,6 @@ async def test_manage_runbook_start_defaults(mock_client_manager):
     assert result["status"] == "started"
 
 
-@pytest.mark.asyncio
-async def test_manage_runbook_cancel(mock_client_manager):
-    """Test cancelling a runbook."""
-    # Set up mock response
-    mock_client_manager.request.return_value = {"status": "cancelled"}
-
-    # Call the function
-    result = await runbooks.manage_runbook(
-        runbook_id="rb123",
-        action="cancel",
-        message="Cancelling due to issue",
-        notify=True,
-    )
-
-    # Verify the API call
-    mock_client_manager.request.assert_called_once_with(
-        "PATCH",
-        "core/runbooks/rb123/cancel",
-        json_data={
-            "meta": {
-                "message": "Cancelling due to issue",
-                "notify": True,
-            }
-        },
-    )
-
-    # Verify the result
-    assert result["status"] == "cancelled"
-
-
-@pytest.mark.asyncio
-async def test_manage_runbook_pause(mock_client_manager):
-    """Test pausing a runbook."""
-    # Set up mock response
-    mock_client_manager.request.return_value = {"status": "paused"}
-
-    # Call the function
-    result = await runbooks.manage_runbook(runbook_id="rb123", action="pause", message="Pausing for review")
-
-    # Verify the API call
-    mock_client_manager.request.assert_called_once_with(
-        "PATCH",
-        "core/runbooks/rb123/pause",
-        json_data={"meta": {"message": "Pausing for review", "notify": False}},
-    )
-
-    # Verify the result
-    assert result["status"] == "paused"
-
-
-@pytest.mark.asyncio
-async def test_manage_runbook_resume(mock_client_manager):
-    """Test resuming a runbook."""
-    # Set up mock response
-    mock_client_manager.request.return_value = {"status": "resumed"}
-
-    # Call the function
-    result = await runbooks.manage_runbook(runbook_id="rb123", action="resume")
-
-    # Verify the API call
-    mock_client_manager.request.assert_called_once_with(
-        "PATCH", "core/runbooks/rb123/resume", json_data={"meta": {"notify": False}}
-    )
-
-    # Verify the result
-    assert result["status"] == "resumed"
-
-
 @pytest.mark.asyncio
 async def test_manage_runbook_invalid_action(mock_client_manager):
     """Test invalid action for manage_runbook."""
@@ -764,40 +874,21 @@ async def test_manage_runbook_schema_enums():
     assert enum_branches[0]["enum"] == ["warning", "error"]
 
 
-@pytest.mark.asyncio
-async def test_runbook_not_found_error(mock_client_manager):
-    """Test handling 404 error when runbook not found."""
-    # Set up mock to raise an error
-    mock_response = AsyncMock()
-    mock_response.status_code = 404
-    mock_response.text = "Runbook not found"
-
-    mock_client_manager.request.side_effect = httpx.HTTPStatusError(
-        "Client error '404 Not Found'",
-        request=AsyncMock(),
-        response=mock_response,
-    )
-
-    # Should raise the exception
-    with pytest.raises(httpx.HTTPStatusError) as exc_info:
-        await runbooks.get_runbook_by_id("invalid-rb")
-
-    assert exc_info.value.response.status_code == 404
-
-
 @pytest.mark.asyncio
 async def test_update_runbook_with_custom_field_values(mock_client_manager):
     """Test updating a runbook with custom field values."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "rb123",
-            "type": "runbook",
-            "attributes": {
-                "name": "Runbook with Custom Fields",
-            },
+    mock_client_manager.request.return_value = RunbookResponse.model_validate(
+        {
+            "data": {
+                "id": "rb123",
+                "type": "runbook",
+                "attributes": {
+                    "name": "Runbook with Custom Fields",
+                },
+            }
         }
-    }
+    )
 
     custom_fields = [
         {"name": "Environment", "value": "Production"},
@@ -818,6 +909,7 @@ async def test_update_runbook_with_custom_field_values(mock_client_manager):
                 "attributes": {"custom_field_values": custom_fields},
             }
         },
+        model=RunbookResponse,
     )
 
 
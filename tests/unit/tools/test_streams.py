@@ -1,7 +1,6 @@
-from unittest.mock import AsyncMock
-
 import pytest
 
+from cutover_mcp.models import StreamListResponse, StreamResponse
 from cutover_mcp.tools import streams
 
 
@@ -9,35 +8,39 @@ from cutover_mcp.tools import streams
 async def test_list_streams_without_forecast(mock_client_manager):
     """Test listing streams without forecast data."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": [
-            {
-                "id": "stream1",
-                "type": "stream",
-                "attributes": {
-                    "name": "Primary Stream",
-                    "description": "Main execution stream",
-                    "is_primary": True,
+    mock_client_manager.request.return_value = StreamListResponse.model_validate(
+        {
+            "data": [
+                {
+                    "id": "stream1",
+                    "type": "stream",
+                    "attributes": {
+                        "name": "Primary Stream",
+                        "description": "Main execution stream",
+                        "is_primary": True,
+                    },
                 },
-            },
-            {
-                "id": "stream2",
-                "type": "stream",
-                "attributes": {
-                    "name": "Secondary Stream",
-                    "is_primary": False,
+                {
+                    "id": "stream2",
+                    "type": "stream",
+                    "attributes": {
+                        "name": "Secondary Stream",
+                        "is_primary": False,
+                    },
                 },
-            },
-        ],
-        "meta": {"page": {"number": 1}},
-        "links": {},
-    }
+            ],
+            "meta": {"page": {"number": 1}},
+            "links": {},
+        }
+    )
 
     # Call the function
     result = await streams.list_streams(runbook_id="rb123")
 
     # Verify the API call
-    mock_client_manager.request.assert_called_once_with("GET", "core/runbooks/rb123/streams", params={})
+    mock_client_manager.request.assert_called_once_with(
+        "GET", "core/runbooks/rb123/streams", params={}, model=StreamListResponse
+    )
 
     # Verify the result
     assert len(result.data) == 2
@@ -49,28 +52,30 @@ async def test_list_streams_without_forecast(mock_client_manager):
 async def test_list_streams_with_forecast(mock_client_manager):
     """Test listing streams with forecast data."""
     # Set up mock response with forecast fields
-    mock_client_manager.request.return_value = {
-        "data": [
-            {
-                "id": "stream1",
-                "type": "stream",
-                "attributes": {
-                    "name": "Stream with Forecast",
-                    "start_display": "2024-01-01T10:00:00Z",
-                    "end_display": "2024-01-01T12:00:00Z",
-                },
-            }
-        ],
-        "meta": {"page": {"number": 1}},
-        "links": {},
-    }
+    mock_client_manager.request.return_value = StreamListResponse.model_validate(
+        {
+            "data": [
+                {
+                    "id": "stream1",
+                    "type": "stream",
+                    "attributes": {
+                        "name": "Stream with Forecast",
+                        "start_display": "2024-01-01T10:00:00Z",
+                        "end_display": "2024-01-01T12:00:00Z",
+                    },
+                }
+            ],
+            "meta": {"page": {"number": 1}},
+            "links": {},
+        }
+    )
 
     # Call the function with forecast
     result = await streams.list_streams(runbook_id="rb123", forecast=True)
 
     # Verify the API call includes forecast parameter
     mock_client_manager.request.assert_called_once_with(
-        "GET", "core/runbooks/rb123/streams", params={"forecast": "true"}
+        "GET", "core/runbooks/rb123/streams", params={"forecast": "true"}, model=StreamListResponse
     )
 
     # Verify the result
@@ -81,17 +86,19 @@ async def test_list_streams_with_forecast(mock_client_manager):
 async def test_create_stream_minimal(mock_client_manager):
     """Test creating a stream with minimal parameters."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "new-stream",
-            "type": "stream",
-            "attributes": {
-                "name": "New Stream",
-                "description": "",
-                "is_primary": False,
-            },
+    mock_client_manager.request.return_value = StreamResponse.model_validate(
+        {
+            "data": {
+                "id": "new-stream",
+                "type": "stream",
+                "attributes": {
+                    "name": "New Stream",
+                    "description": "",
+                    "is_primary": False,
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     result = await streams.create_stream(runbook_id="rb123", name="New Stream")
@@ -106,6 +113,7 @@ async def test_create_stream_minimal(mock_client_manager):
                 "attributes": {"name": "New Stream"},
             }
         },
+        model=StreamResponse,
     )
 
     # Verify the result
@@ -117,17 +125,19 @@ async def test_create_stream_minimal(mock_client_manager):
 async def test_create_stream_with_color_and_description(mock_client_manager):
     """Test creating a stream with color and description."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "colored-stream",
-            "type": "stream",
-            "attributes": {
-                "name": "Colored Stream",
-                "description": "A stream with color",
-                "color": "#ff5733",
-            },
+    mock_client_manager.request.return_value = StreamResponse.model_validate(
+        {
+            "data": {
+                "id": "colored-stream",
+                "type": "stream",
+                "attributes": {
+                    "name": "Colored Stream",
+                    "description": "A stream with color",
+                    "color": "#ff5733",
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     result = await streams.create_stream(
@@ -151,6 +161,7 @@ async def test_create_stream_with_color_and_description(mock_client_manager):
                 },
             }
         },
+        model=StreamResponse,
     )
 
     # Verify the result
@@ -161,17 +172,19 @@ async def test_create_stream_with_color_and_description(mock_client_manager):
 async def test_create_substream(mock_client_manager):
     """Test creating a substream with parent."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "substream1",
-            "type": "stream",
-            "attributes": {
-                "name": "Substream",
-                "is_primary": False,
-            },
-            "relationships": {"parent": {"data": {"id": "parent-stream", "type": "stream"}}},
+    mock_client_manager.request.return_value = StreamResponse.model_validate(
+        {
+            "data": {
+                "id": "substream1",
+                "type": "stream",
+                "attributes": {
+                    "name": "Substream",
+                    "is_primary": False,
+                },
+                "relationships": {"parent": {"data": {"id": "parent-stream", "type": "stream"}}},
+            }
         }
-    }
+    )
 
     # Call the function with parent
     result = await streams.create_stream(runbook_id="rb123", name="Substream", parent_stream_id="parent-stream")
@@ -187,6 +200,7 @@ async def test_create_substream(mock_client_manager):
                 "relationships": {"parent": {"data": {"id": "parent-stream", "type": "stream"}}},
             }
         },
+        model=StreamResponse,
     )
 
     # Verify the result has parent relationship
@@ -197,23 +211,27 @@ async def test_create_substream(mock_client_manager):
 async def test_get_stream(mock_client_manager):
     """Test getting a specific stream."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "stream123",
-            "type": "stream",
-            "attributes": {
-                "name": "Specific Stream",
-                "description": "Retrieved stream",
-                "tasks_count": 5,
-            },
+    mock_client_manager.request.return_value = StreamResponse.model_validate(
+        {
+            "data": {
+                "id": "stream123",
+                "type": "stream",
+                "attributes": {
+                    "name": "Specific Stream",
+                    "description": "Retrieved stream",
+                    "tasks_count": 5,
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     result = await streams.get_stream(runbook_id="rb123", stream_id="stream123")
 
     # Verify the API call
-    mock_client_manager.request.assert_called_once_with("GET", "core/runbooks/rb123/streams/stream123")
+    mock_client_manager.request.assert_called_once_with(
+        "GET", "core/runbooks/rb123/streams/stream123", model=StreamResponse
+    )
 
     # Verify the result
     assert result.data.id == "stream123"
@@ -224,16 +242,18 @@ async def test_get_stream(mock_client_manager):
 async def test_update_stream_name_only(mock_client_manager):
     """Test updating only the stream name."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "stream123",
-            "type": "stream",
-            "attributes": {
-                "name": "Updated Name",
-                "description": "Original description",
-            },
+    mock_client_manager.request.return_value = StreamResponse.model_validate(
+        {
+            "data": {
+                "id": "stream123",
+                "type": "stream",
+                "attributes": {
+                    "name": "Updated Name",
+                    "description": "Original description",
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     result = await streams.update_stream(runbook_id="rb123", stream_id="stream123", name="Updated Name")
@@ -249,6 +269,7 @@ async def test_update_stream_name_only(mock_client_manager):
                 "attributes": {"name": "Updated Name"},
             }
         },
+        model=StreamResponse,
     )
 
     # Verify the result
@@ -259,17 +280,19 @@ async def test_update_stream_name_only(mock_client_manager):
 async def test_update_stream_all_fields(mock_client_manager):
     """Test updating all stream fields."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "stream123",
-            "type": "stream",
-            "attributes": {
-                "name": "Fully Updated",
-                "description": "New description",
-                "color": "#00ff00",
-            },
+    mock_client_manager.request.return_value = StreamResponse.model_validate(
+        {
+            "data": {
+                "id": "stream123",
+                "type": "stream",
+                "attributes": {
+                    "name": "Fully Updated",
+                    "description": "New description",
+                    "color": "#00ff00",
+                },
+            }
         }
-    }
+    )
 
     # Call the function with all params
     result = await streams.update_stream(
@@ -295,6 +318,7 @@ async def test_update_stream_all_fields(mock_client_manager):
                 },
             }
         },
+        model=StreamResponse,
     )
 
     # Verify all fields were updated
@@ -319,34 +343,13 @@ async def test_delete_stream(mock_client_manager):
     assert result == {}
 
 
-@pytest.mark.asyncio
-async def test_stream_not_found_error(mock_client_manager):
-    """Test handling 404 error when stream not found."""
-    import httpx
-
-    # Set up mock to raise an error
-    mock_response = AsyncMock()
-    mock_response.status_code = 404
-    mock_response.text = "Stream not found"
-
-    mock_client_manager.request.side_effect = httpx.HTTPStatusError(
-        "Client error '404 Not Found'",
-        request=AsyncMock(),
-        response=mock_response,
-    )
-
-    # Should raise the exception
-    with pytest.raises(httpx.HTTPStatusError) as exc_info:
-        await streams.get_stream("rb123", "invalid-stream")
-
-    assert exc_info.value.response.status_code == 404
-
-
 @pytest.mark.asyncio
 async def test_empty_stream_list(mock_client_manager):
     """Test handling empty stream list."""
     # Set up mock response with empty data
-    mock_client_manager.request.return_value = {"data": [], "meta": {"page": {"number": 1}}, "links": {}}
+    mock_client_manager.request.return_value = StreamListResponse.model_validate(
+        {"data": [], "meta": {"page": {"number": 1}}, "links": {}}
+    )
 
     # Call the function
     result = await streams.list_streams(runbook_id="rb123")
@@ -1,9 +1,22 @@
-from unittest.mock import AsyncMock
-
 import pytest
 
 from cutover_mcp.tools import task_types
 
+LARGE_TASK_TYPES_RESPONSE = {
+    "data": [
+        {
+            "id": f"tt{i}",
+            "type": "task_type",
+            "attributes": {
+                "name": f"Task Type {i}",
+                "description": f"Description for task type {i}",
+            },
+        }
+        for i in range(100)
+    ],
+    "meta": {"count": 100},
+}
+
 
 @pytest.mark.asyncio
 async def test_list_task_types(mock_client_manager):
@@ -111,73 +124,10 @@ async def test_list_task_types_minimal_attributes(mock_client_manager):
     assert "color" not in result["data"][0]["attributes"] or result["data"][0]["attributes"]["color"] is None
 
 
-@pytest.mark.asyncio
-async def test_list_task_types_error_handling(mock_client_manager):
-    """Test error handling for task types listing."""
-    import httpx
-
-    # Set up mock to raise an error
-    mock_response = AsyncMock()
-    mock_response.status_code = 500
-    mock_response.text = "Internal Server Error"
-
-    mock_client_manager.request.side_effect = httpx.HTTPStatusError(
-        "Server error '500 Internal Server Error'",
-        request=AsyncMock(),
-        response=mock_response,
-    )
-
-    # Should raise the exception
-    with pytest.raises(httpx.HTTPStatusError) as exc_info:
-        await task_types.list_task_types()
-
-    assert exc_info.value.response.status_code == 500
-
-
-@pytest.mark.asyncio
-async def test_list_task_types_authentication_error(mock_client_manager):
-    """Test authentication error for task types listing."""
-    import httpx
-
-    # Set up mock to raise authentication error
-    mock_response = AsyncMock()
-    mock_response.status_code = 401
-    mock_response.text = "Unauthorized"
-
-    mock_client_manager.request.side_effect = httpx.HTTPStatusError(
-        "Client error '401 Unauthorized'",
-        request=AsyncMock(),
-        response=mock_response,
-    )
-
-    # Should raise the exception
-    with pytest.raises(httpx.HTTPStatusError) as exc_info:
-        await task_types.list_task_types()
-
-    assert exc_info.value.response.status_code == 401
-
-
 @pytest.mark.asyncio
 async def test_list_task_types_large_response(mock_client_manager):
     """Test handling large number of task types."""
-    # Set up mock response with large number of task types
-    large_data = []
-    for i in range(100):
-        large_data.append(
-            {
-                "id": f"tt{i}",
-                "type": "task_type",
-                "attributes": {
-                    "name": f"Task Type {i}",
-                    "description": f"Description for task type {i}",
-                },
-            }
-        )
-
-    mock_client_manager.request.return_value = {
-        "data": large_data,
-        "meta": {"count": 100},
-    }
+    mock_client_manager.request.return_value = LARGE_TASK_TYPES_RESPONSE
 
     # Call the function
     result = await task_types.list_task_types()
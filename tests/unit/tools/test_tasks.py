@@ -1,9 +1,9 @@
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
 
 import httpx
 import pytest
 
-from cutover_mcp.models import Assignee, TaskLink, TaskLinkResponse
+from cutover_mcp.models import Assignee, TaskLink, TaskLinkResponse, TaskResponse
 from cutover_mcp.tools import tasks
 
 
@@ -11,17 +11,19 @@ from cutover_mcp.tools import tasks
 async def test_add_task_to_runbook_minimal(mock_client_manager):
     """Test adding a task with minimal parameters."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task123",
-            "type": "task",
-            "attributes": {
-                "name": "New Task",
-                "description": "",
-                "stage": "not_startable",
-            },
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task123",
+                "type": "task",
+                "attributes": {
+                    "name": "New Task",
+                    "description": "",
+                    "stage": "not_startable",
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     result = await tasks.add_task_to_runbook(runbook_id="rb123", name="New Task")
@@ -31,6 +33,7 @@ async def test_add_task_to_runbook_minimal(mock_client_manager):
         "POST",
         "core/runbooks/rb123/tasks",
         json_data={"data": {"type": "task", "attributes": {"name": "New Task", "description": ""}}},
+        model=TaskResponse,
     )
 
     # Verify the result
@@ -44,23 +47,25 @@ async def test_add_task_to_runbook_minimal(mock_client_manager):
 async def test_add_task_to_runbook_full_params(mock_client_manager):
     """Test adding a task with all parameters."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task456",
-            "type": "task",
-            "attributes": {
-                "name": "Full Task",
-                "description": "Task with all params",
-                "stage": "not_startable",
-                "duration": 3600,
-            },
-            "relationships": {
-                "task_type": {"data": {"id": "tt123", "type": "task_type"}},
-                "stream": {"data": {"id": "stream123", "type": "stream"}},
-                "predecessors": {"data": [{"id": "pred1", "type": "task"}]},
-            },
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task456",
+                "type": "task",
+                "attributes": {
+                    "name": "Full Task",
+                    "description": "Task with all params",
+                    "stage": "not_startable",
+                    "duration": 3600,
+                },
+                "relationships": {
+                    "task_type": {"data": {"id": "tt123", "type": "task_type"}},
+                    "stream": {"data": {"id": "stream123", "type": "stream"}},
+                    "predecessors": {"data": [{"id": "pred1", "type": "task"}]},
+                },
+            }
         }
-    }
+    )
 
     # Call the function with all params
     result = await tasks.add_task_to_runbook(
@@ -88,6 +93,7 @@ async def test_add_task_to_runbook_full_params(mock_client_manager):
                 },
             }
         },
+        model=TaskResponse,
     )
 
     # Verify the result
@@ -99,17 +105,19 @@ async def test_add_task_to_runbook_full_params(mock_client_manager):
 async def test_add_task_to_runbook_with_duration(mock_client_manager):
     """Test adding a task with duration."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task789",
-            "type": "task",
-            "attributes": {
-                "name": "Timed Task",
-                "description": "",
-                "duration": 1800,
-            },
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task789",
+                "type": "task",
+                "attributes": {
+                    "name": "Timed Task",
+                    "description": "",
+                    "duration": 1800,
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     result = await tasks.add_task_to_runbook(runbook_id="rb123", name="Timed Task", duration=1800)
@@ -119,6 +127,7 @@ async def test_add_task_to_runbook_with_duration(mock_client_manager):
         "POST",
         "core/runbooks/rb123/tasks",
         json_data={"data": {"type": "task", "attributes": {"name": "Timed Task", "description": "", "duration": 1800}}},
+        model=TaskResponse,
     )
 
     # Verify the result
@@ -128,18 +137,20 @@ async def test_add_task_to_runbook_with_duration(mock_client_manager):
 @pytest.mark.asyncio
 async def test_add_task_to_runbook_with_task_links_runbook(mock_client_manager):
     """Test adding a linked task that points at a template runbook."""
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task999",
-            "type": "task",
-            "attributes": {
-                "name": "Linked Task",
-                "description": "",
-                "task_links": [{"id": 1234, "link_type": "runbook"}],
-            },
-            "relationships": {"task_type": {"data": {"id": "3", "type": "task_type"}}},
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task999",
+                "type": "task",
+                "attributes": {
+                    "name": "Linked Task",
+                    "description": "",
+                    "task_links": [{"id": 1234, "link_type": "runbook"}],
+                },
+                "relationships": {"task_type": {"data": {"id": "3", "type": "task_type"}}},
+            }
         }
-    }
+    )
 
     result = await tasks.add_task_to_runbook(
         runbook_id="rb123",
@@ -164,6 +175,7 @@ async def test_add_task_to_runbook_with_task_links_runbook(mock_client_manager):
                 },
             }
         },
+        model=TaskResponse,
     )
     assert result.data.attributes.task_links == [TaskLinkResponse(id=1234, link_type="runbook")]
 
@@ -175,18 +187,20 @@ async def test_add_task_to_runbook_task_links_asymmetric_str_in_int_out(mock_cli
     runbook/snippet). Locks in the two-type model — TaskLink(str) for input,
     TaskLinkResponse(int) for output.
     """
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task997",
-            "type": "task",
-            "attributes": {
-                "name": "Linked Task",
-                "description": "",
-                "task_links": [{"id": 316, "link_type": "runbook"}],  # int, as the API returns
-            },
-            "relationships": {"task_type": {"data": {"id": "3", "type": "task_type"}}},
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task997",
+                "type": "task",
+                "attributes": {
+                    "name": "Linked Task",
+                    "description": "",
+                    "task_links": [{"id": 316, "link_type": "runbook"}],  # int, as the API returns
+                },
+                "relationships": {"task_type": {"data": {"id": "3", "type": "task_type"}}},
+            }
         }
-    }
+    )
 
     result = await tasks.add_task_to_runbook(
         runbook_id="rb123",
@@ -205,20 +219,22 @@ async def test_add_task_to_runbook_task_links_asymmetric_str_in_int_out(mock_cli
 @pytest.mark.asyncio
 async def test_add_task_to_runbook_with_task_links_snippets(mock_client_manager):
     """Test adding a task with multiple snippet links."""
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task998",
-            "type": "task",
-            "attributes": {
-                "name": "Snippeted Task",
-                "description": "",
-                "task_links": [
-                    {"id": 10, "link_type": "snippet"},
-                    {"id": 11, "link_type": "snippet"},
-                ],
-            },
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task998",
+                "type": "task",
+                "attributes": {
+                    "name": "Snippeted Task",
+                    "description": "",
+                    "task_links": [
+                        {"id": 10, "link_type": "snippet"},
+                        {"id": 11, "link_type": "snippet"},
+                    ],
+                },
+            }
         }
-    }
+    )
 
     result = await tasks.add_task_to_runbook(
         runbook_id="rb123",
@@ -245,6 +261,7 @@ async def test_add_task_to_runbook_with_task_links_snippets(mock_client_manager)
                 },
             }
         },
+        model=TaskResponse,
     )
     assert result.data.attributes.task_links == [
         TaskLinkResponse(id=10, link_type="snippet"),
@@ -256,16 +273,18 @@ async def test_add_task_to_runbook_with_task_links_snippets(mock_client_manager)
 async def test_add_task_to_runbook_with_predecessors(mock_client_manager):
     """Test adding a task with predecessors."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task789",
-            "type": "task",
-            "attributes": {"name": "Dependent Task", "description": ""},
-            "relationships": {
-                "predecessors": {"data": [{"id": "pred1", "type": "task"}, {"id": "pred2", "type": "task"}]}
-            },
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task789",
+                "type": "task",
+                "attributes": {"name": "Dependent Task", "description": ""},
+                "relationships": {
+                    "predecessors": {"data": [{"id": "pred1", "type": "task"}, {"id": "pred2", "type": "task"}]}
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     await tasks.add_task_to_runbook(runbook_id="rb123", name="Dependent Task", predecessors=["pred1", "pred2"])
@@ -283,6 +302,7 @@ async def test_add_task_to_runbook_with_predecessors(mock_client_manager):
                 },
             }
         },
+        model=TaskResponse,
     )
 
 
@@ -290,16 +310,18 @@ async def test_add_task_to_runbook_with_predecessors(mock_client_manager):
 async def test_update_runbook_task_name_only(mock_client_manager):
     """Test updating a task with only name."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task123",
-            "type": "task",
-            "attributes": {
-                "name": "Updated Task Name",
-                "description": "Original description",
-            },
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task123",
+                "type": "task",
+                "attributes": {
+                    "name": "Updated Task Name",
+                    "description": "Original description",
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     result = await tasks.update_runbook_task(runbook_id="rb123", task_id="task123", name="Updated Task Name")
@@ -309,6 +331,7 @@ async def test_update_runbook_task_name_only(mock_client_manager):
         "PATCH",
         "core/runbooks/rb123/tasks/task123",
         json_data={"data": {"type": "task", "id": "task123", "attributes": {"name": "Updated Task Name"}}},
+        model=TaskResponse,
     )
 
     # Verify the result
@@ -319,18 +342,20 @@ async def test_update_runbook_task_name_only(mock_client_manager):
 async def test_update_runbook_task_with_predecessors(mock_client_manager):
     """Test updating a task with predecessors."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task123",
-            "type": "task",
-            "attributes": {
-                "name": "Task with Dependencies",
-            },
-            "relationships": {
-                "predecessors": {"data": [{"id": "pred1", "type": "task"}, {"id": "pred2", "type": "task"}]}
-            },
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task123",
+                "type": "task",
+                "attributes": {
+                    "name": "Task with Dependencies",
+                },
+                "relationships": {
+                    "predecessors": {"data": [{"id": "pred1", "type": "task"}, {"id": "pred2", "type": "task"}]}
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     await tasks.update_runbook_task(runbook_id="rb123", task_id="task123", predecessors=["pred1", "pred2"])
@@ -349,6 +374,7 @@ async def test_update_runbook_task_with_predecessors(mock_client_manager):
                 },
             }
         },
+        model=TaskResponse,
     )
 
 
@@ -356,16 +382,18 @@ async def test_update_runbook_task_with_predecessors(mock_client_manager):
 async def test_update_runbook_task_with_duration(mock_client_manager):
     """Test updating a task with duration."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task123",
-            "type": "task",
-            "attributes": {
-                "name": "Timed Task",
-                "duration": 7200,
-            },
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task123",
+                "type": "task",
+                "attributes": {
+                    "name": "Timed Task",
+                    "duration": 7200,
+                },
+            }
         }
-    }
+    )
 
     # Call the function
     await tasks.update_runbook_task(runbook_id="rb123", task_id="task123", duration=7200)
@@ -375,6 +403,7 @@ async def test_update_runbook_task_with_duration(mock_client_manager):
         "PATCH",
         "core/runbooks/rb123/tasks/task123",
         json_data={"data": {"type": "task", "id": "task123", "attributes": {"duration": 7200}}},
+        model=TaskResponse,
     )
 
 
@@ -382,15 +411,17 @@ async def test_update_runbook_task_with_duration(mock_client_manager):
 async def test_update_runbook_task_with_custom_field_values(mock_client_manager):
     """Test updating a task with custom field values."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task123",
-            "type": "task",
-            "attributes": {
-                "name": "Task with Custom Fields",
-            },
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task123",
+                "type": "task",
+                "attributes": {
+                    "name": "Task with Custom Fields",
+                },
+            }
         }
-    }
+    )
 
     custom_fields = [
         {"name": "Priority", "value": "High"},
@@ -411,6 +442,7 @@ async def test_update_runbook_task_with_custom_field_values(mock_client_manager)
                 "attributes": {"custom_field_values": custom_fields},
             }
         },
+        model=TaskResponse,
     )
 
 
@@ -418,22 +450,24 @@ async def test_update_runbook_task_with_custom_field_values(mock_client_manager)
 async def test_update_runbook_task_all_params(mock_client_manager):
     """Test updating a task with all parameters."""
     # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task123",
-            "type": "task",
-            "attributes": {
-                "name": "Fully Updated Task",
-                "description": "New description",
-                "duration": 900,
-            },
-            "relationships": {
-                "predecessors": {"data": [{"id": "pred1", "type": "task"}]},
-                "task_type": {"data": {"id": "tt456", "type": "task_type"}},
-                "stream": {"data": {"id": "stream456", "type": "stream"}},
-            },
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task123",
+                "type": "task",
+                "attributes": {
+                    "name": "Fully Updated Task",
+                    "description": "New description",
+                    "duration": 900,
+                },
+                "relationships": {
+                    "predecessors": {"data": [{"id": "pred1", "type": "task"}]},
+                    "task_type": {"data": {"id": "tt456", "type": "task_type"}},
+                    "stream": {"data": {"id": "stream456", "type": "stream"}},
+                },
+            }
         }
-    }
+    )
 
     custom_fields = [{"name": "Status", "value": "Ready"}]
 
@@ -471,22 +505,25 @@ async def test_update_runbook_task_all_params(mock_client_manager):
                 },
             }
         },
+        model=TaskResponse,
     )
 
 
 @pytest.mark.asyncio
 async def test_update_runbook_task_with_task_links(mock_client_manager):
     """Test updating a task's links (e.g. swap the target template of a linked task)."""
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task123",
-            "type": "task",
-            "attributes": {
-                "name": "Task",
-                "task_links": [{"id": 555, "link_type": "runbook"}],
-            },
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {
+            "data": {
+                "id": "task123",
+                "type": "task",
+                "attributes": {
+                    "name": "Task",
+                    "task_links": [{"id": 555, "link_type": "runbook"}],
+                },
+            }
         }
-    }
+    )
 
     result = await tasks.update_runbook_task(
         runbook_id="rb123",
@@ -504,6 +541,7 @@ async def test_update_runbook_task_with_task_links(mock_client_manager):
                 "attributes": {"task_links": [{"id": "555", "link_type": "runbook"}]},
             }
         },
+        model=TaskResponse,
     )
     assert result.data.attributes.task_links == [TaskLinkResponse(id=555, link_type="runbook")]
 
@@ -511,9 +549,9 @@ async def test_update_runbook_task_with_task_links(mock_client_manager):
 @pytest.mark.asyncio
 async def test_update_runbook_task_clear_task_links(mock_client_manager):
     """Empty list clears all task links."""
-    mock_client_manager.request.return_value = {
-        "data": {"id": "task123", "type": "task", "attributes": {"name": "Task"}}
-    }
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {"data": {"id": "task123", "type": "task", "attributes": {"name": "Task"}}}
+    )
 
     await tasks.update_runbook_task(runbook_id="rb123", task_id="task123", task_links=[])
 
@@ -527,15 +565,16 @@ async def test_update_runbook_task_clear_task_links(mock_client_manager):
                 "attributes": {"task_links": []},
             }
         },
+        model=TaskResponse,
     )
 
 
 @pytest.mark.asyncio
 async def test_update_runbook_task_with_assignees(mock_client_manager):
     """Test updating a task with assignees (additive, default behaviour)."""
-    mock_client_manager.request.return_value = {
-        "data": {"id": "task123", "type": "task", "attributes": {"name": "Task"}}
-    }
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {"data": {"id": "task123", "type": "task", "attributes": {"name": "Task"}}}
+    )
 
     assignees = [Assignee(id="user1", type="user"), Assignee(id="team1", type="runbook_team")]
 
@@ -555,15 +594,16 @@ async def test_update_runbook_task_with_assignees(mock_client_manager):
             },
             "meta": {"delete_excluded_assignees": False},
         },
+        model=TaskResponse,
     )
 
 
 @pytest.mark.asyncio
 async def test_update_runbook_task_with_assignees_replace(mock_client_manager):
     """Test updating a task with delete_excluded_assignees=True replaces the full list."""
-    mock_client_manager.request.return_value = {
-        "data": {"id": "task123", "type": "task", "attributes": {"name": "Task"}}
-    }
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {"data": {"id": "task123", "type": "task", "attributes": {"name": "Task"}}}
+    )
 
     assignees = [Assignee(id="user2", type="user")]
 
@@ -582,63 +622,34 @@ async def test_update_runbook_task_with_assignees_replace(mock_client_manager):
                 "type": "task",
                 "id": "task123",
                 "attributes": {},
-                "relationships": {
-                    "assignees": {"data": [{"id": "user2", "type": "user"}]}
-                },
+                "relationships": {"assignees": {"data": [{"id": "user2", "type": "user"}]}},
             },
             "meta": {"delete_excluded_assignees": True},
         },
+        model=TaskResponse,
     )
 
 
+@pytest.mark.parametrize(
+    ("transition", "action", "stage"),
+    [
+        pytest.param(tasks.start_task, "start", "in_progress", id="start"),
+        pytest.param(tasks.complete_task, "finish", "complete", id="complete"),
+    ],
+)
 @pytest.mark.asyncio
-async def test_start_task(mock_client_manager):
-    """Test starting a task."""
-    # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task123",
-            "type": "task",
-            "attributes": {
-                "name": "Started Task",
-                "stage": "in_progress",
-            },
-        }
-    }
-
-    # Call the function
-    result = await tasks.start_task(runbook_id="rb123", task_id="task123")
-
-    # Verify the API call
-    mock_client_manager.request.assert_called_once_with("PATCH", "core/runbooks/rb123/tasks/task123/start")
-
-    # Verify the result
-    assert result.data.attributes.stage == "in_progress"
-
-
-@pytest.mark.asyncio
-async def test_complete_task(mock_client_manager):
-    """Test completing a task."""
-    # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "task123",
-            "type": "task",
-            "attributes": {
-                "name": "Completed Task",
-                "stage": "complete",
-            },
-        }
-    }
-
-    # Call the function
-    result = await tasks.complete_task(runbook_id="rb123", task_id="task123")
+async def test_task_transitions(mock_client_manager, transition, action, stage):
+    """Test starting and completing a task."""
+    mock_client_manager.request.return_value = TaskResponse.model_validate(
+        {"data": {"id": "task123", "type": "task", "attributes": {"name": "Task", "stage": stage}}}
+    )
 
-    # Verify the API call
-    mock_client_manager.request.assert_called_once_with("PATCH", "core/runbooks/rb123/tasks/task123/finish")
+    result = await transition(runbook_id="rb123", task_id="task123")
 
-    # Verify the result
-    assert result.data.attributes.stage == "complete"
+    mock_client_manager.request.assert_called_once_with(
+        "PATCH", f"core/runbooks/rb123/tasks/task123/{action}", model=TaskResponse
+    )
+    assert result.data.attributes.stage == stage
 
 
 @pytest.mark.asyncio
@@ -665,12 +676,10 @@ async def test_skip_task(mock_client_manager):
 async def test_task_error_handling(mock_client_manager):
     """Test error handling for task operations."""
     # Set up mock to raise an error
-    mock_response = AsyncMock()
-    mock_response.status_code = 404
-    mock_response.text = "Task not found"
+    mock_response = SimpleNamespace(status_code=404, text="Task not found")
 
     mock_client_manager.request.side_effect = httpx.HTTPStatusError(
-        "Client error '404 Not Found'", request=AsyncMock(), response=mock_response
+        "Client error '404 Not Found'", request=SimpleNamespace(), response=mock_response
     )
 
     # Should raise the exception
@@ -697,14 +706,10 @@ async def test_delete_task(mock_client_manager):
 @pytest.mark.asyncio
 async def test_delete_task_not_found(mock_client_manager):
     """Test deleting a task that doesn't exist returns 404."""
-    import httpx
-
-    mock_response = AsyncMock()
-    mock_response.status_code = 404
-    mock_response.text = "Task not found"
+    mock_response = SimpleNamespace(status_code=404, text="Task not found")
 
     mock_client_manager.request.side_effect = httpx.HTTPStatusError(
-        "Client error '404 Not Found'", request=AsyncMock(), response=mock_response
+        "Client error '404 Not Found'", request=SimpleNamespace(), response=mock_response
     )
 
     with pytest.raises(httpx.HTTPStatusError) as exc_info:
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
 
 import httpx
 import pytest
@@ -107,13 +107,11 @@ async def test_get_user_missing_name_fields(mock_client_manager):
 async def test_get_user_error_handling(mock_client_manager):
     """Test error handling when user is not found."""
     # Set up mock to raise an error
-    mock_response = AsyncMock()
-    mock_response.status_code = 404
-    mock_response.text = "User not found"
+    mock_response = SimpleNamespace(status_code=404, text="User not found")
 
     mock_client_manager.request.side_effect = httpx.HTTPStatusError(
         "Client error '404 Not Found'",
-        request=AsyncMock(),
+        request=SimpleNamespace(),
         response=mock_response,
     )
 
@@ -1,5 +1,6 @@
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
 
+import httpx
 import pytest
 
 from cutover_mcp.tools import workspaces
@@ -19,7 +20,9 @@ async def test_get_workspace_by_id(mock_client_manager):
     result = await workspaces.get_workspace_by_id("ws123")
 
     # Verify the API call
-    mock_client_manager.request.assert_called_once_with("GET", "core/workspaces/ws123")
+    mock_client_manager.request.assert_called_once_with(
+        "GET", "core/workspaces/ws123", stale_ttl=workspaces.WORKSPACE_STALE_TTL
+    )
 
     # Verify the result
     assert result["id"] == "ws123"
@@ -40,7 +43,9 @@ async def test_query_workspaces(mock_client_manager):
     result = await workspaces.query_workspaces("prod")
 
     # Verify the API call
-    mock_client_manager.request.assert_called_once_with("GET", "core/workspaces", params={"query": "prod"})
+    mock_client_manager.request.assert_called_once_with(
+        "GET", "core/workspaces", params={"query": "prod"}, stale_ttl=workspaces.WORKSPACE_STALE_TTL
+    )
 
     # Verify the result
     assert len(result["data"]) == 2
@@ -58,7 +63,10 @@ async def test_list_workspaces_default_params(mock_client_manager):
 
     # Verify the API call with default pagination
     mock_client_manager.request.assert_called_once_with(
-        "GET", "core/workspaces", params={"page[limit]": 50, "page[offset]": 0}
+        "GET",
+        "core/workspaces",
+        params={"page[limit]": 50, "page[offset]": 0},
+        stale_ttl=workspaces.WORKSPACE_STALE_TTL,
     )
 
     # Verify the result
@@ -79,7 +87,10 @@ async def test_list_workspaces_with_pagination(mock_client_manager):
 
     # Verify the API call
     mock_client_manager.request.assert_called_once_with(
-        "GET", "core/workspaces", params={"page[limit]": 2, "page[offset]": 2}
+        "GET",
+        "core/workspaces",
+        params={"page[limit]": 2, "page[offset]": 2},
+        stale_ttl=workspaces.WORKSPACE_STALE_TTL,
     )
 
     # Verify the result
@@ -87,81 +98,47 @@ async def test_list_workspaces_with_pagination(mock_client_manager):
     assert result["data"][0]["id"] == "ws3"
 
 
+@pytest.mark.parametrize(
+    ("kwargs", "expected_attributes"),
+    [
+        pytest.param(
+            {"name": "New Workspace"},
+            {"name": "New Workspace", "description": "", "key": ""},
+            id="minimal",
+        ),
+        pytest.param(
+            {"name": "Full Workspace", "description": "A complete workspace", "key": "FULL"},
+            {"name": "Full Workspace", "description": "A complete workspace", "key": "FULL"},
+            id="full_params",
+        ),
+    ],
+)
 @pytest.mark.asyncio
-async def test_create_workspace_minimal(mock_client_manager):
-    """Test creating a workspace with minimal parameters."""
-    # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "ws_new",
-            "type": "workspace",
-            "attributes": {"name": "New Workspace", "description": "", "key": ""},
-        }
-    }
-
-    # Call the function with minimal params
-    result = await workspaces.create_workspace(name="New Workspace")
-
-    # Verify the API call
-    mock_client_manager.request.assert_called_once_with(
-        "POST",
-        "core/workspaces",
-        json_data={
-            "data": {"type": "workspace", "attributes": {"name": "New Workspace", "description": "", "key": ""}}
-        },
-    )
-
-    # Verify the result
-    assert result["data"]["id"] == "ws_new"
-    assert result["data"]["attributes"]["name"] == "New Workspace"
-
-
-@pytest.mark.asyncio
-async def test_create_workspace_full_params(mock_client_manager):
-    """Test creating a workspace with all parameters."""
-    # Set up mock response
-    mock_client_manager.request.return_value = {
-        "data": {
-            "id": "ws_full",
-            "type": "workspace",
-            "attributes": {"name": "Full Workspace", "description": "A complete workspace", "key": "FULL"},
-        }
-    }
+async def test_create_workspace(mock_client_manager, kwargs, expected_attributes):
+    """Test creating a workspace; omitted description and key are sent as empty strings."""
+    response = {"data": {"id": "ws_new", "type": "workspace", "attributes": expected_attributes}}
+    mock_client_manager.request.return_value = response
 
-    # Call the function with all params
-    result = await workspaces.create_workspace(name="Full Workspace", description="A complete workspace", key="FULL")
+    result = await workspaces.create_workspace(**kwargs)
 
-    # Verify the API call
     mock_client_manager.request.assert_called_once_with(
         "POST",
         "core/workspaces",
-        json_data={
-            "data": {
-                "type": "workspace",
-                "attributes": {"name": "Full Workspace", "description": "A complete workspace", "key": "FULL"},
-            }
-        },
+        json_data={"data": {"type": "workspace", "attributes": expected_attributes}},
     )
-
-    # Verify the result
-    assert result["data"]["attributes"]["key"] == "FULL"
-    assert result["data"]["attributes"]["description"] == "A complete workspace"
+    assert result == response
 
 
 @pytest.mark.asyncio
 async def test_workspace_not_found_error(mock_client_manager):
     """Test handling 404 error when workspace not found."""
     # Import the actual httpx exception for more realistic testing
-    import httpx
-
     # Set up mock to raise an HTTPStatusError
-    mock_response = AsyncMock()
-    mock_response.status_code = 404
-    mock_response.text = "Workspace not found"
+    mock_response = SimpleNamespace(status_code=404, text="Workspace not found")
 
     mock_client_manager.request.side_effect = httpx.HTTPStatusError(
         "Client error '404 Not Found' for url 'https://test.cutover.com/core/workspaces/invalid'",
-        request=AsyncMock(),
+        request=SimpleNamespace(),
         response=mock_response,
     )
 
@@ -200,7 +177,9 @@ async def test_query_workspaces_special_characters(mock_client_manager):
     result = await workspaces.query_workspaces("Test & Dev")
 
     # Verify the API call properly passes the query
-    mock_client_manager.request.assert_called_once_with("GET", "core/workspaces", params={"query": "Test & Dev"})
+    mock_client_manager.request.assert_called_once_with(
+        "GET", "core/workspaces", params={"query": "Test & Dev"}, stale_ttl=workspaces.WORKSPACE_STALE_TTL
+    )
 
     # Verify the result
     assert len(result["data"]) == 1